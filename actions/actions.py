@@ -68,7 +68,7 @@ class AddEntity(Action):
         self.entity = entity
 
     def perform(self):
-        self.section.entities.append(self.entity)
+        self.section.add_entity(self.entity)
 
 class DeleteEntity(Action):
     def __init__(self, engine, section, entity):
@@ -154,28 +154,32 @@ class ChangeVolumeAction(Action):
         return self.engine.set_mixer_volume(value)
 
 class StatueMaterialChiseled(Action):
-    def __init__(self, engine, entity) -> None:
+    def __init__(self, engine, section, x, y) -> None:
         super().__init__(engine)
-        self.entity = entity
+        self.section = section
+        self.x = x
+        self.y = y
         
     def perform(self) -> None:
-        return self.entity.section.remove_entity(self.entity)
+        return self.section.remove_material(self.x, self.y)
 
 class BlockMaterialChiseled(Action):
-    def __init__(self, engine, entity) -> None:
+    def __init__(self, engine, section, x, y) -> None:
         super().__init__(engine)
-        self.entity = entity
+        self.section = section
+        self.x = x
+        self.y = y
 
     def perform(self) -> None:
-        return self.entity.section.remove_entity(self.entity)
+        return self.section.remove_material(self.x, self.y)
 
 class ChiselMistakeAction(Action):
-    def __init__(self, engine, entity) -> None:
+    def __init__(self, engine, section) -> None:
         super().__init__(engine)
-        self.entity = entity
+        self.section = section
         
     def perform(self) -> None:
-        return self.entity.section.chisel_fault()
+        return self.section.chisel_fault()
 
 class SelectLevelAction(Action):
     def __init__(self, engine, stage, level) -> None:
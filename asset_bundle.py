@@ -0,0 +1,140 @@
+import glob
+import gzip
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+import xp_loader
+from application_path import get_app_path
+
+##################################
+# Bundle layout:
+## An 8 byte magic, a uint32 format version and a uint32 header length, all little-endian
+## The header, a JSON object mapping each asset name (its path relative to the game directory, e.g. "images/level1-1.xp") to
+## its offset and length in the file, its kind ("xp" or "json"), the modification time of the file it was packed from in
+## nanoseconds, and for xp assets the dtype, shape and XP version
+## The asset data itself, each entry aligned to bundle_alignment bytes. xp assets are stored as the stacked Fortran ordered
+## graphic_dt arrays produced by xp_loader.stack_layers, json assets as their raw utf-8 text
+##################################
+
+bundle_magic = b"HERCBNDL"
+bundle_version = 2
+bundle_alignment = 16
+bundle_filename = "assets.bundle"
+bundle_preamble = struct.Struct("<8sII")
+
+
+def normalise_asset_name(filepath):
+    return os.path.normpath(filepath).replace("\\", "/")
+
+
+class AssetBundle():
+    """
+    A read only view of a packed asset bundle, memory mapped once so assets are resolved without opening any other files.
+    """
+    def __init__(self, filepath):
+        with open(filepath, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_length = bundle_preamble.unpack_from(self.data, 0)
+        if magic != bundle_magic or version != bundle_version:
+            raise ValueError("\"" + filepath + "\" is not a version " + str(bundle_version) + " asset bundle")
+
+        header_start = bundle_preamble.size
+        self.index = json.loads(bytes(self.data[header_start:header_start + header_length]))
+
+    def has_asset(self, filepath):
+        """ Whether the bundle holds an up to date copy of filepath. A loose file edited since the bundle was built takes priority """
+        entry = self.index.get(normalise_asset_name(filepath))
+        if entry is None:
+            return False
+
+        try:
+            return os.stat(filepath).st_mtime_ns == entry["mtime_ns"]
+        except FileNotFoundError:
+            # Shipped builds only carry the bundle
+            return True
+
+    def get_xp(self, filepath):
+        entry = self.index[normalise_asset_name(filepath)]
+        tiles = np.ndarray(tuple(entry["shape"]), dtype=np.lib.format.descr_to_dtype(entry["dtype"]), buffer=self.data, offset=entry["offset"], order="F")
+        return xp_loader.unstack_layers(tiles, entry["version"])
+
+    def get_json(self, filepath):
+        entry = self.index[normalise_asset_name(filepath)]
+        return json.loads(bytes(self.data[entry["offset"]:entry["offset"] + entry["length"]]).decode("utf-8"))
+
+
+def build_bundle(output_path, asset_paths):
+    index = dict()
+    blobs = list()
+
+    for filepath in asset_paths:
+        name = normalise_asset_name(filepath)
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        if filepath.endswith(".xp"):
+            with gzip.open(filepath) as f:
+                xp_data = xp_loader.load_xp_array(f.read())
+            tiles = xp_loader.stack_layers(xp_data)
+            index[name] = {"kind": "xp", "dtype": np.lib.format.dtype_to_descr(tiles.dtype), "shape": tiles.shape, "version": xp_data['version'], "mtime_ns": mtime_ns}
+            blobs.append((name, tiles.tobytes(order="F")))
+        elif filepath.endswith(".json"):
+            with open(filepath, "rb") as f:
+                index[name] = {"kind": "json", "mtime_ns": mtime_ns}
+                blobs.append((name, f.read()))
+
+    # Offsets depend on the header length, which depends on the offsets, so lay the data out until the header stops growing
+    header = b""
+    while True:
+        offset = bundle_preamble.size + len(header)
+        for name, blob in blobs:
+            offset += -offset % bundle_alignment
+            index[name]["offset"] = offset
+            index[name]["length"] = len(blob)
+            offset += len(blob)
+
+        new_header = json.dumps(index).encode("utf-8")
+        converged = len(new_header) == len(header)
+        header = new_header
+        if converged:
+            break
+
+    with open(output_path + ".tmp", "wb") as f:
+        f.write(bundle_preamble.pack(bundle_magic, bundle_version, len(header)))
+        f.write(header)
+        for name, blob in blobs:
+            f.write(b"\0" * (index[name]["offset"] - f.tell()))
+            f.write(blob)
+    os.replace(output_path + ".tmp", output_path)
+
+
+def open_bundle():
+    bundle_path = os.path.join(get_app_path(), bundle_filename)
+    if not os.path.isfile(bundle_path):
+        return None
+
+    try:
+        return AssetBundle(bundle_path)
+    except (OSError, ValueError) as e:
+        print("Failed to open asset bundle, falling back to loose files: " + str(e))
+        return None
+
+
+bundle = open_bundle()
+
+def load_json(filepath):
+    if bundle is not None and bundle.has_asset(filepath):
+        return bundle.get_json(filepath)
+
+    with open(filepath) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    os.chdir(get_app_path())
+    asset_paths = sorted(glob.glob("images/*.xp")) + sorted(glob.glob("fonts/*.xp")) + sorted(glob.glob("game_data/*.json"))
+    build_bundle(bundle_filename, asset_paths)
+    print("Wrote " + str(len(asset_paths)) + " assets to " + bundle_filename)
@@ -0,0 +1,134 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+from appdirs import user_cache_dir
+
+import asset_bundle
+import xp_loader
+
+# Bump this whenever load_xp_array changes what it produces, so stale caches get rebuilt
+cache_format_version = 1
+
+
+class AssetCache():
+    """
+    Compiles .xp files into uncompressed .npy arrays on disk so warm startups skip gzip and parsing entirely.
+    Every layer of a file is stacked into one Fortran ordered (width, height, layer_count) graphic_dt array, which is memory mapped on load.
+    Entries are keyed by the source path and validated against its mtime, falling back to a content hash when the mtime has moved.
+    """
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.index_path = os.path.join(self.cache_path, "index.json")
+        self.index = dict()
+        self.writable = True
+        self.lock = threading.Lock()
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+        except OSError:
+            self.writable = False
+
+        if os.path.isfile(self.index_path):
+            try:
+                with open(self.index_path) as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = dict()
+
+        if self.index.get("format_version") != cache_format_version:
+            self.index = {"format_version": cache_format_version, "entries": dict()}
+
+    def load_xp(self, filepath):
+        # Levels are prefetched on a worker thread, so only one load may touch the index at a time
+        with self.lock:
+            return self.load_xp_locked(filepath)
+
+    def load_xp_locked(self, filepath):
+        key = os.path.abspath(filepath)
+        entry = self.index["entries"].get(key)
+        mtime = os.path.getmtime(filepath)
+
+        if entry is not None and self.is_entry_valid(entry, filepath, mtime):
+            xp_data = self.load_entry(key, entry)
+            if xp_data is not None:
+                return xp_data
+
+        return self.build_entry(key, filepath, mtime)
+
+    def is_entry_valid(self, entry, filepath, mtime):
+        if entry["mtime"] == mtime:
+            return True
+
+        with open(filepath, "rb") as f:
+            content_hash = hashlib.sha1(f.read()).hexdigest()
+        if entry["hash"] == content_hash:
+            entry["mtime"] = mtime
+            self.save_index()
+            return True
+
+        return False
+
+    def load_entry(self, key, entry):
+        try:
+            tiles = np.load(self.get_array_path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        return xp_loader.unstack_layers(tiles, entry["version"])
+
+    def build_entry(self, key, filepath, mtime):
+        with open(filepath, "rb") as f:
+            compressed_data = f.read()
+
+        xp_data = xp_loader.load_xp_array(gzip.decompress(compressed_data))
+        if not self.writable:
+            return xp_data
+
+        tiles = xp_loader.stack_layers(xp_data)
+
+        array_path = self.get_array_path(key)
+        try:
+            with open(array_path + ".tmp", "wb") as f:
+                np.save(f, tiles)
+            os.replace(array_path + ".tmp", array_path)
+        except OSError:
+            self.writable = False
+            return xp_data
+
+        self.index["entries"][key] = {"mtime": mtime, "hash": hashlib.sha1(compressed_data).hexdigest(), "version": xp_data['version']}
+        self.save_index()
+
+        return self.load_entry(key, self.index["entries"][key]) or xp_data
+
+    def save_index(self):
+        if not self.writable:
+            return
+
+        try:
+            with open(self.index_path + ".tmp", "w") as f:
+                json.dump(self.index, f)
+            os.replace(self.index_path + ".tmp", self.index_path)
+        except OSError:
+            self.writable = False
+
+    def get_array_path(self, key):
+        return os.path.join(self.cache_path, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".npy")
+
+
+xp_cache = AssetCache(os.path.join(user_cache_dir("fhercules", "rsherriff"), "xp"))
+
+def load_xp_file(filepath):
+    if asset_bundle.bundle is not None and asset_bundle.bundle.has_asset(filepath):
+        return asset_bundle.bundle.get_xp(filepath)
+
+    return xp_cache.load_xp(filepath)
+
+def xp_file_exists(filepath):
+    if asset_bundle.bundle is not None and asset_bundle.bundle.has_asset(filepath):
+        return True
+
+    return os.path.isfile(filepath)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import tracemalloc
+
+# Imported first as it sets up the null audio device and working directory the rest of the game expects
+from headless import HeadlessRunner, launch_directory, print_report
+
+import numpy as np
+import tcod.event
+from application_path import get_app_path
+from data.statue_summary import StatueSummary
+from engine import GameState
+from entities.material_grid import LeftClickAction, MaterialType
+from sections.statue_section import StatueState
+from sections.statue_summary_section import SummaryState
+
+# Scenarios are cut short after this many frames, so one that never reaches its goal can't hang the suite
+max_scenario_frames = 3000
+
+# Game time each chisel is given to clear its tile before moving on to the next
+chisel_wait = 0.12
+
+
+def run_intro(runner):
+    """ The intro splash sequence, up until it hands over to the menu """
+    runner.run_until(lambda: runner.engine.state != GameState.INTRO, max_scenario_frames)
+
+
+def run_menu_carousel(runner):
+    """ Flicks forward through every stage in the stage select screen and back again, letting each wipe finish """
+    runner.skip_intro()
+    menu = runner.engine.menu_sections["Menu"]
+    menu.enter_stage_select()
+    runner.run(60)
+
+    stage_order = list(range(1, len(menu.stages))) + list(range(len(menu.stages) - 2, -1, -1))
+    for stage_index in stage_order or [0]:
+        menu.change_stage(stage_index)
+        runner.run_until(lambda: not menu.transition_effect.in_effect, max_scenario_frames)
+        runner.run(10)
+
+
+def run_level_load(stage_index, level_index):
+    def run(runner):
+        """ A level's load, timed on its own, then its load sequence from the footer sliding in until the level can be played """
+        runner.start_level(stage_index, level_index)
+        statue_section = runner.engine.game_sections["statueSection"]
+        runner.run_until(lambda: statue_section.state == StatueState.IN_PROGRESS, max_scenario_frames)
+
+    return run
+
+
+def run_chiselling(chisels):
+    def run(runner):
+        """ Chisels away the first level's exposed blocks one at a time """
+        runner.start_level(0, 0)
+        statue_section = runner.engine.game_sections["statueSection"]
+        runner.run_until(lambda: statue_section.state == StatueState.IN_PROGRESS, max_scenario_frames)
+
+        materials = statue_section.materials
+        for _ in range(chisels):
+            target = get_chisel_target(statue_section)
+            if target is None:
+                break
+
+            x, y = target
+            chisel_button = tcod.event.MouseButton.RIGHT if materials.kind[x, y] == MaterialType.BLOCK else tcod.event.MouseButton.LEFT
+            if materials.left_click_action == LeftClickAction.CARVE:
+                chisel_button = tcod.event.MouseButton.LEFT if chisel_button == tcod.event.MouseButton.RIGHT else tcod.event.MouseButton.RIGHT
+
+            runner.click(x, y, chisel_button)
+            runner.run_for(chisel_wait)
+
+    return run
+
+
+def get_chisel_target(statue_section):
+    """ The top left-most block that can be chiselled right now, or a statue tile if there are no blocks left """
+    materials = statue_section.materials
+    candidates = materials.alive & ~materials.dying
+    for material_type in (MaterialType.BLOCK, MaterialType.STATUE):
+        xs, ys = np.nonzero(candidates & (materials.kind == material_type))
+        for i in np.lexsort((xs, ys)):
+            if statue_section.connectivity.is_exposed(xs[i], ys[i]):
+                return int(xs[i]), int(ys[i])
+
+    return None
+
+
+def run_summary(runner):
+    """ The summary screen's scoring animation after finishing the first level without faults """
+    runner.start_level(0, 0)
+    runner.run(1)
+
+    summary_section = runner.engine.game_sections["statueSummarySection"]
+    runner.engine.level_complete(StatueSummary(runner.engine.level, 0))
+    runner.run_until(lambda: not runner.engine.is_ui_paused(), max_scenario_frames)
+
+    # Wait out the pause before scoring starts, then run until the last crown has been counted
+    runner.run_until(lambda: summary_section.state == SummaryState.SCORING, max_scenario_frames)
+    scoring_frames = math.ceil(summary_section.scoring_time / runner.loop.frame_time) + 60
+    runner.run(min(scoring_frames, max_scenario_frames))
+
+
+def get_scenarios(chisels):
+    scenarios = dict()
+    scenarios["intro"] = run_intro
+    scenarios["menu_carousel"] = run_menu_carousel
+
+    runner = HeadlessRunner()
+    for stage_index, stage in enumerate(runner.engine.menu_sections["Menu"].stages):
+        for level_index in range(len(stage["levels"])):
+            scenarios["level_load_" + str(stage_index) + "_" + str(level_index)] = run_level_load(stage_index, level_index)
+
+    scenarios["chiselling"] = run_chiselling(chisels)
+    scenarios["summary_scoring"] = run_summary
+    return scenarios
+
+
+def run_scenario(scenario, step, trace_allocations):
+    # Each run starts from the same seed, so two runs of the suite play out the same frames
+    random.seed(0)
+    np.random.seed(0)
+
+    runner = HeadlessRunner(step=step)
+    if trace_allocations:
+        tracemalloc.start()
+    try:
+        scenario(runner)
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+
+    return runner
+
+
+def run_suite(scenarios, step, trace_allocations):
+    """ Runs each scenario once for timings, then again with tracemalloc on for allocations, as tracing slows every frame down """
+    results = dict()
+    for name, scenario in scenarios.items():
+        report = run_scenario(scenario, step, False).get_report()
+        if trace_allocations:
+            report["allocations"] = run_scenario(scenario, step, True).get_report().get("allocations")
+
+        results[name] = report
+        print(name)
+        print_report(report)
+
+    return results
+
+
+def get_git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=get_app_path(), stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_reports(old_report, new_report):
+    """ Prints how each scenario's p50, p95 and p99 total frame time, and level load time, moved between two reports """
+    print("{:<30} {:>22} {:>22} {:>22}".format("scenario", "p50 ms", "p95 ms", "p99 ms"))
+    for name, new_result in new_report["scenarios"].items():
+        old_result = old_report["scenarios"].get(name)
+        if old_result is None:
+            continue
+
+        for phase in ("total", "load"):
+            if phase not in old_result or phase not in new_result:
+                continue
+
+            columns = list()
+            for stat in ("p50_ms", "p95_ms", "p99_ms"):
+                old_value = old_result[phase][stat]
+                new_value = new_result[phase][stat]
+                change = (new_value - old_value) / old_value * 100 if old_value > 0 else 0
+                columns.append("{:7.3f} -> {:7.3f} {:+4.0f}%".format(old_value, new_value, change))
+
+            print("{:<30} {:>22} {:>22} {:>22}".format(name + " " + phase, *columns))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Runs scripted scenarios headlessly and writes their frame times and allocations to a JSON report.")
+    parser.add_argument("--output", default="benchmark_report.json", help="where to write the JSON report")
+    parser.add_argument("--compare", help="an earlier report to compare this run's frame times against")
+    parser.add_argument("--step", type=float, default=1 / 30, help="seconds the synthetic clock advances each simulation step")
+    parser.add_argument("--chisels", type=int, default=30, help="how many tiles the chiselling scenario chisels")
+    parser.add_argument("--scenario", action="append", help="only run scenarios whose names start with this, can be given more than once")
+    parser.add_argument("--skip-allocations", action="store_true", help="don't do the second, traced run of each scenario")
+    args = parser.parse_args()
+
+    scenarios = get_scenarios(args.chisels)
+    if args.scenario is not None:
+        scenarios = {name: scenario for name, scenario in scenarios.items() if any(name.startswith(prefix) for prefix in args.scenario)}
+
+    report = dict()
+    report["commit"] = get_git_commit()
+    report["python"] = platform.python_version()
+    report["numpy"] = np.__version__
+    report["tcod"] = tcod.__version__
+    report["step"] = args.step
+    report["scenarios"] = run_suite(scenarios, args.step, not args.skip_allocations)
+
+    output_path = os.path.join(launch_directory, args.output)
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print("Wrote " + str(len(report["scenarios"])) + " scenarios to " + output_path)
+
+    if args.compare is not None:
+        with open(os.path.join(launch_directory, args.compare)) as f:
+            compare_reports(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
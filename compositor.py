@@ -0,0 +1,39 @@
+import numpy as np
+from tcod.console import Console
+
+
+class Compositor():
+    """
+    Keeps the last presented frame in a persistent buffer and works out which part of each newly rendered frame differs from it,
+    so only the changed rectangle is copied across and a frame that hasn't changed doesn't need presenting at all.
+    """
+    def __init__(self, width: int, height: int):
+        self.frame = Console(width, height, order="F")
+        self.back_buffer = Console(width, height, order="F")
+        self.dirty_rect = None
+        self.needs_present = True
+
+    def invalidate(self):
+        """ Forces the next frame to be presented even if nothing in it changed, e.g. after the window was resized or exposed """
+        self.needs_present = True
+
+    def compose(self, render):
+        """ Renders a frame into the back buffer with render(console) and copies whatever changed into frame. Returns whether frame needs presenting """
+        self.back_buffer.clear()
+        render(self.back_buffer)
+
+        changed = self.back_buffer.tiles_rgb != self.frame.tiles_rgb
+        changed_columns = np.flatnonzero(changed.any(axis=1))
+        changed_rows = np.flatnonzero(changed.any(axis=0))
+
+        if len(changed_columns) == 0:
+            self.dirty_rect = None
+        else:
+            x, y = int(changed_columns[0]), int(changed_rows[0])
+            width, height = int(changed_columns[-1]) + 1 - x, int(changed_rows[-1]) + 1 - y
+            self.frame.tiles_rgb[x:x + width, y:y + height] = self.back_buffer.tiles_rgb[x:x + width, y:y + height]
+            self.dirty_rect = (x, y, width, height)
+
+        needs_present = self.needs_present or self.dirty_rect is not None
+        self.needs_present = False
+        return needs_present
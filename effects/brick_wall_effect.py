@@ -1,8 +1,10 @@
 from effects.effect import Effect
 
-from tcod import Console
 from enum import auto, Enum
 
+import numpy as np
+import tile_types
+
 class BrickWallDirection(Enum):
     DOWN = auto()
     UP = auto()
@@ -12,6 +14,8 @@ class BrickWallEffect(Effect):
         super().__init__(engine,x,y,width,height)
         self.speed = 100
         self.index_into_render = 0
+
+        self.brick_order = np.arange(width * height).reshape((width, height), order="F")
         
     def start(self, direction: BrickWallDirection):
         super().start()
@@ -22,33 +26,17 @@ class BrickWallEffect(Effect):
             self.stop()
             pass
 
-        temp_console = Console(width=self.width, height=self.height, order="F")
-
-        count = 0
-
+        # Bricks are laid in row order, from the bottom right corner when building up and the top left when building down
         if self.direction == BrickWallDirection.UP:
-            step = -1
-            height_start = self.height - 1
-            width_start = self.width - 1
-            height_end = width_end = -1
+            brick_order = self.brick_order[::-1, ::-1]
         elif self.direction == BrickWallDirection.DOWN:
-            step = 1
-            height_start = width_start = 0
-            height_end = self.height
-            width_end = self.width
-
-
-        for h in range(height_start, height_end, step):
-            for w in range(width_start, width_end, step):
+            brick_order = self.brick_order
 
-                if count >= self.index_into_render:
-                    break
-                    
-                temp_console.tiles_rgb[w,h] = self.tiles[w,h]
-                count += 1
+        laid = brick_order < np.ceil(self.index_into_render)
+        tiles = np.where(laid, self.get_source_tiles(), tile_types.blank_graphic)
 
         self.index_into_render  += self.speed * self.engine.get_delta_time()
 
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=self.x, dest_y=self.y, width=self.width, height=self.height)
+        self.blit_tiles(console, tiles, 0, 0, self.x, self.y, self.width, self.height)
 
         self.time_alive += self.engine.get_delta_time()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import numpy as np
 
 import tile_types
+from utils.utils import blit_tiles
 
 class Effect():
     def __init__(self, engine, x, y, width, height):
@@ -26,6 +27,16 @@ class Effect():
         self.in_effect = False
 
     def set_tiles(self, tiles):
+        """ Takes a copy of tiles as a graphic_dt array, whether they came from tiles_rgb, an RGBA tiles array or tile graphics """
         self.tiles_set = True
-        self.tiles = tiles.copy()
+        self.tiles = np.empty(tiles.shape, dtype=tile_types.graphic_dt, order="F")
+        self.tiles["ch"] = tiles["ch"]
+        self.tiles["fg"] = tiles["fg"][..., :3]
+        self.tiles["bg"] = tiles["bg"][..., :3]
 
+    def get_source_tiles(self):
+        """ The effect's tiles cropped to its own size """
+        return self.tiles[0:self.width, 0:self.height]
+
+    def blit_tiles(self, console, tiles, src_x, src_y, dest_x, dest_y, width, height):
+        blit_tiles(console, tiles, src_x, src_y, dest_x, dest_y, width, height)
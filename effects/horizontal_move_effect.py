@@ -1,6 +1,5 @@
 from effects.effect import Effect
 
-from tcod import Console
 from enum import auto, Enum
 
 class HorizontalMoveDirection(Enum):
@@ -24,15 +23,10 @@ class HorizontalMoveEffect(Effect):
   
         self.current_move_length += self.speed  * self.engine.get_delta_time()
 
-        temp_console = Console(width=self.width, height=self.height, order="F")
-
-        for x in range(0,self.width):
-            for y in range(0, self.height):
-                temp_console.tiles_rgb[x,y] = self.tiles[x,y]
-
+        tiles = self.get_source_tiles()
         if self.direction == HorizontalMoveDirection.LEFT:
-            temp_console.blit(console, src_x=self.width - int(self.current_move_length), src_y=0, dest_x=self.x, dest_y=self.y, width=int(self.current_move_length), height=self.height)
+            self.blit_tiles(console, tiles, self.width - int(self.current_move_length), 0, self.x, self.y, int(self.current_move_length), self.height)
         elif self.direction == HorizontalMoveDirection.RIGHT:
-            temp_console.blit(console, src_x=0, src_y=0, dest_x=self.x +  (self.width - int(self.current_move_length)), dest_y=self.y, width=int(self.current_move_length), height=self.height)
+            self.blit_tiles(console, tiles, 0, 0, self.x +  (self.width - int(self.current_move_length)), self.y, int(self.current_move_length), self.height)
 
         self.time_alive += self.engine.get_delta_time()
\ No newline at end of file
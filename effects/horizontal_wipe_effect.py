@@ -1,6 +1,5 @@
 from effects.effect import Effect
 
-from tcod import Console
 from enum import auto, Enum
 
 class HorizontalWipeDirection(Enum):
@@ -28,12 +27,6 @@ class HorizontalWipeEffect(Effect):
         elif(self.direction == HorizontalWipeDirection.RIGHT):
             self.current_wipe_length += self.speed  * self.engine.get_delta_time()
 
-        temp_console = Console(width=self.width, height=self.height, order="F")
-
-        for x in range(0,self.width):
-            for y in range(0, self.height):
-                temp_console.tiles_rgb[x,y] = self.tiles[x,y]
-
-        temp_console.blit(console, src_x=int(self.current_wipe_length), src_y=0, dest_x=self.x + int(self.current_wipe_length), dest_y=self.y, width=self.width, height=self.height)
+        self.blit_tiles(console, self.get_source_tiles(), int(self.current_wipe_length), 0, self.x + int(self.current_wipe_length), self.y, self.width, self.height)
 
         self.time_alive += self.engine.get_delta_time()
\ No newline at end of file
@@ -1,47 +1,55 @@
 from effects.effect import Effect
-from ctypes import c_uint32
-from tcod import Console
+from functools import lru_cache
+
+import numpy as np
+
+@lru_cache(maxsize=None)
+def get_lfsr_sequence(width, height, feedback):
+    """ Steps the LFSR through its whole cycle from a state of 1, returning each in-bounds tile's (x, y) position in that cycle and the cycle's length """
+    positions = np.full(width * height, -1, dtype=np.int64)
+
+    tile = 1
+    period = 0
+    while True:
+        tile = (tile >> 1) ^ (-(tile & 1) & feedback)
+        if tile < width * height:
+            positions[tile] = period
+        period += 1
+        if tile == 1:
+            break
+
+    return positions.reshape((width, height), order="F"), period
 
 class LFSREffect(Effect):
     def __init__(self, engine, x, y, width, height):
         super().__init__(engine,x,y,width,height)
-        self.current_tile = 0
         self.size = width * height
-        self.tile = c_uint32(1).value
         self.feedback = 0x62B    
+        self.steps_per_frame = 50
 
-        self.temp_console = Console(width=self.width, height=self.height, order="F")
-        self.processed_tiles = []
+        # The LFSR carries on from wherever it got to last time, so each run dissolves the tiles in a different order
+        self.total_steps = 0
+        self.steps_this_run = 0
+        self.run_start = 0
         
     def start(self):
         super().start()
-        self.processed_tiles.clear()
+        self.steps_this_run = 0
+        self.run_start = self.total_steps
         
     def render(self, console):
+        positions, period = get_lfsr_sequence(self.width, self.height, self.feedback)
 
-        for i in range(0, 50): 
-            feedback_this_step = -(self.tile & c_uint32(1).value) & self.feedback
-            self.tile = (self.tile >> 1) ^ feedback_this_step
-
-            tile_width = self.tile % self.width
-            tile_height = int((self.tile - tile_width) / self.width)
-
-            tile_tuple = (tile_width, tile_height)
-
-            if tile_tuple not in self.processed_tiles:
-                self.processed_tiles.append(tile_tuple)
-            else:
-                self.stop()
-
-        tile_console = Console(width=1, height=1, order="F")
-        for x in range(0,self.width):
-            for y in range(0,self.height):
-                if (x,y) not in self.processed_tiles:
-                    tile_console.tiles_rgb[0,0] = self.tiles[x,y]
-                    tile_console.blit(console, src_x=0, src_y=0, dest_x=x, dest_y=y, width=1, height=1)
-
-
+        self.total_steps += self.steps_per_frame
+        self.steps_this_run += self.steps_per_frame
 
+        # Once every tile in the cycle has come up the next step repeats one
+        if self.steps_this_run > period:
+            self.stop()
 
+        processed = (positions >= 0) & ((positions - self.run_start) % period < min(self.steps_this_run, period))
 
-        
\ No newline at end of file
+        width = min(self.width, console.width)
+        height = min(self.height, console.height)
+        tiles = console.tiles_rgb[0:width, 0:height]
+        tiles[:] = np.where(processed[0:width, 0:height], tiles, self.tiles[0:width, 0:height])
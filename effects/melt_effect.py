@@ -1,6 +1,5 @@
 from effects.effect import Effect
 
-from tcod import Console
 from enum import auto, Enum
 from random import randrange
 
@@ -23,41 +22,34 @@ class MeltWipeEffect(Effect):
         
     def start(self):
         super().start()
-        self.current_wipe_heights = np.empty(self.width)
-        self.current_wipe_heights.fill(0)
-        for col in range(0,self.width):
-            if self.type == MeltWipeEffectType.WAVE_LEFT:
-                wave_step = 1 / self.lifespan
-                self.col_trigger_times[col] = wave_step * col
-            elif self.type == MeltWipeEffectType.WAVE_RIGHT:
-                wave_step = 1 / self.lifespan
-                self.col_trigger_times[-col - 1] = wave_step * col
-            elif self.type == MeltWipeEffectType.RANDOM:
-                wave_step = 0.25
-                self.col_trigger_times[col] = wave_step * randrange(int(self.lifespan / 3))
+        self.current_wipe_heights = np.zeros(self.width)
+
+        columns = np.arange(self.width)
+        if self.type == MeltWipeEffectType.WAVE_LEFT:
+            wave_step = 1 / self.lifespan
+            self.col_trigger_times[:] = wave_step * columns
+        elif self.type == MeltWipeEffectType.WAVE_RIGHT:
+            wave_step = 1 / self.lifespan
+            self.col_trigger_times[::-1] = wave_step * columns
+        elif self.type == MeltWipeEffectType.RANDOM:
+            wave_step = 0.25
+            self.col_trigger_times[:] = wave_step * np.array([randrange(int(self.lifespan / 3)) for col in columns])
         
     def render(self, console):
+        triggered = self.time_alive > self.col_trigger_times
+        self.current_wipe_heights[triggered] += (self.height / self.lifespan) * (self.engine.get_delta_time() * 10)
 
-        columns_finished = True        
-        
-        for col in range(0, self.width):
-            if self.time_alive > self.col_trigger_times[col]:
-                self.current_wipe_heights[col] += (self.height / self.lifespan) * (self.engine.get_delta_time() * 10)
-
-            if self.current_wipe_heights[col] < self.height:
-                columns_finished = False
-
-            temp_console = Console(width=1, height=self.height, order="F")
-
-            for y in range(0, self.height):
-                temp_console.tiles_rgb[0,y] = self.tiles[col,y]
+        # Each column is drawn shifted down by its wipe height, so every cell reads the tile that many rows above it
+        width = min(self.width, console.width)
+        height = min(self.height, console.height)
+        source_rows = np.arange(height)[np.newaxis, :] - self.current_wipe_heights[:width, np.newaxis].astype(int)
+        source_columns = np.broadcast_to(np.arange(width)[:, np.newaxis], source_rows.shape)
+        visible = source_rows >= 0
 
-            temp_console.blit(console, src_x=0, src_y=0,
-                                        dest_x=col, dest_y= int(self.current_wipe_heights[col]), 
-                                        width=1, height=self.height - int(self.current_wipe_heights[col]))
+        console.tiles_rgb[0:width, 0:height][visible] = self.tiles[source_columns[visible], source_rows[visible]]
 
         self.time_alive += self.engine.get_delta_time()
-        if columns_finished == True:
+        if np.all(self.current_wipe_heights >= self.height):
             self.stop()
 
         
\ No newline at end of file
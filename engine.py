@@ -11,12 +11,15 @@ import tcod
 from pygame import mixer
 from tcod.console import Console
 
+import asset_bundle
 from actions.actions import OpenNotificationDialog
 from application_path import get_app_path
+from compositor import Compositor
 from effects.lfsr_effect import LFSREffect
 from effects.melt_effect import MeltWipeEffect, MeltWipeEffectType
 from fonts.font_manager import FontManager
 from input_handlers import EventHandler, MainGameEventHandler
+from scheduler import Scheduler
 from sections.confirmation import Confirmation
 from sections.intro_section import IntroSection
 from sections.menu_section import MenuSection
@@ -32,9 +35,10 @@ class GameState(Enum):
     IN_GAME = auto()
 
 class Engine(abc.ABC):
-    def __init__(self, save_path, teminal_width: int, terminal_height: int):
+    def __init__(self, save_path, teminal_width: int, terminal_height: int, delta_time: DeltaTime = None, music = None):
 
         mixer.init()
+        self.music = music if music is not None else mixer.music
 
         self.save_path = save_path
 
@@ -50,7 +54,9 @@ class Engine(abc.ABC):
 
         self.screen_width = teminal_width
         self.screen_height = terminal_height
-        self.delta_time = DeltaTime()
+        self.delta_time = delta_time if delta_time is not None else DeltaTime()
+        self.compositor = Compositor(self.screen_width, self.screen_height)
+        self.scheduler = Scheduler()
 
         self.player = None
 
@@ -60,9 +66,6 @@ class Engine(abc.ABC):
         self.setup_effects()
         self.setup_sections()
 
-        self.tick_length = 2
-        self.time_since_last_tick = -2
-
         self.state = GameState.INTRO
 
         self.font_manager = FontManager()
@@ -72,12 +75,11 @@ class Engine(abc.ABC):
         self.playing_menu_music = False
 
         levels_path = "game_data/levels_demo.json" if self.demo else "game_data/levels.json"
-        with open ( levels_path ) as f:
-            data = json.load(f)
+        data = asset_bundle.load_json(levels_path)
 
-            self.intro_sections["introSection"].load_splashes(data["intro_splashes"])
+        self.intro_sections["introSection"].load_splashes(data["intro_splashes"])
 
-            self.load_initial_data(data)
+        self.load_initial_data(data)
             
     def create_new_save_data(self):
         self.save_data = dict()
@@ -109,21 +111,19 @@ class Engine(abc.ABC):
 
         #root_console.print(40, 1, str(self.mouse_location), (255,255,255))
 
+    def compose_frame(self) -> bool:
+        """ Renders the game into the compositor's frame, returning whether it changed and needs presenting """
+        return self.compositor.compose(lambda console: self.event_handler.on_render(root_console=console))
+
     def update(self):
         """ Engine update tick """
         for _, section in self.get_active_sections():
             section.update()
 
         self.delta_time.update_delta_time()
+        self.scheduler.update(self.get_delta_time())
 
-        if self.is_in_game():
-            self.time_since_last_tick += self.get_delta_time()
-
-            self.tick_length -= 0.0002
-            if self.time_since_last_tick > self.tick_length and self.state == self.is_in_game():
-                self.time_since_last_tick = 0
-
-        if self.in_stage_music_queue and not mixer.music.get_busy():
+        if self.in_stage_music_queue and not self.music.get_busy():
             self.advance_music_queue()
 
     def late_update(self):
@@ -208,7 +208,7 @@ class Engine(abc.ABC):
         volume = self.stage_music[stage]["music_volume"]
         if len(music) > 0:
             random.shuffle(music)
-            mixer.music.set_volume(self.save_data["volume"])
+            self.music.set_volume(self.save_data["volume"])
             self.current_music_index = 0
             self.music_queue = music
             self.advance_music_queue()
@@ -216,7 +216,7 @@ class Engine(abc.ABC):
         
     def advance_music_queue(self):
         print("Playing: " + self.music_queue[self.current_music_index])
-        mixer.music.load("sounds/music/" + self.music_queue[self.current_music_index])
+        self.music.load("sounds/music/" + self.music_queue[self.current_music_index])
         self.current_music_index += 1
 
         if self.current_music_index >= len(self.music_queue):
@@ -225,24 +225,24 @@ class Engine(abc.ABC):
         self.play_music()
 
     def play_music(self):
-        mixer.music.play()
+        self.music.play()
 
     def end_music_queue(self, fadeout_time):
-        mixer.music.fadeout(fadeout_time)
+        self.music.fadeout(fadeout_time)
         self.in_stage_music_queue = False
 
     def play_music_file(self, file):
         if not self.in_stage_music_queue:
-            mixer.music.load("sounds/music/" + file)
-            mixer.music.play()
+            self.music.load("sounds/music/" + file)
+            self.music.play()
 
     def play_menu_music(self, file=""):
         if not self.playing_menu_music:
             self.playing_menu_music = True
             if len(file) > 0:
                 self.menu_music = file
-            mixer.music.load("sounds/music/" + self.menu_music)
-            mixer.music.play()
+            self.music.load("sounds/music/" + self.menu_music)
+            self.music.play()
 
     def open_menu(self):
         self.change_state(GameState.MENU)
@@ -256,6 +256,19 @@ class Engine(abc.ABC):
     def get_delta_time(self):
         return self.delta_time.get_delta_time()
 
+    def get_smoothed_delta_time(self):
+        return self.delta_time.get_smoothed_delta_time()
+
+    def pause_time(self):
+        """ Stops game time, so updates carry on but effects, fades and scheduled calls hold where they are """
+        self.delta_time.pause()
+
+    def resume_time(self):
+        self.delta_time.resume()
+
+    def set_time_scale(self, time_scale: float):
+        self.delta_time.set_time_scale(time_scale)
+
     def quit(self):
         raise SystemExit()
 
@@ -315,7 +328,7 @@ class Engine(abc.ABC):
         self.lfsr_screen_effect.start()
 
     def set_mixer_volume(self, volume):
-        mixer.music.set_volume(volume)
+        self.music.set_volume(volume)
         with open(self.save_path, "w") as f:
             self.save_data["volume"] = volume
             json.dump(self.save_data, f, indent=2)
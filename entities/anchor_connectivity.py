@@ -0,0 +1,82 @@
+from collections import deque
+
+import numpy as np
+
+
+def dilate(mask):
+    """ Grows a boolean mask by one cell in all eight directions """
+    grown = mask.copy()
+    grown[1:, :] |= mask[:-1, :]
+    grown[:-1, :] |= mask[1:, :]
+
+    result = grown.copy()
+    result[:, 1:] |= grown[:, :-1]
+    result[:, :-1] |= grown[:, 1:]
+    return result
+
+
+class AnchorConnectivity:
+    """
+    Works out which material cells are exposed to a section's anchor, meaning there is an open 8-connected path from the cell to the anchor.
+    The open area around the anchor is flood filled once whenever the board changes, and when a cell is chiselled away only the cells
+    it newly joins up are flooded and rechecked, so checking a cell is a single mask lookup.
+    """
+    def __init__(self, section):
+        self.section = section
+        self.reachable = None
+        self.exposed = None
+        self.dirty = True
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def is_exposed(self, x: int, y: int):
+        if self.dirty:
+            self.rebuild()
+        return bool(self.exposed[x, y])
+
+    def rebuild(self):
+        cost = self.section.cost
+        anchor = self.section.anchor
+
+        self.reachable = np.zeros(cost.shape, dtype=bool, order="F")
+        if anchor is not None and cost[anchor.x, anchor.y] > 0:
+            self.reachable[anchor.x, anchor.y] = True
+            self.flood(cost, [(anchor.x, anchor.y)])
+
+        self.exposed = dilate(self.reachable) & self.section.materials.alive
+        self.dirty = False
+
+    def open_cell(self, x: int, y: int):
+        """ Call once the cost grid shows x, y as passable. Opening a cell can only ever join areas up, never split them """
+        if self.dirty:
+            return
+
+        # The chiselled cell itself isn't material any more, so it can't be exposed
+        self.exposed[x, y] = False
+
+        cost = self.section.cost
+        if cost[x, y] <= 0 or self.reachable[x, y] or not self.reachable[max(x - 1, 0):x + 2, max(y - 1, 0):y + 2].any():
+            return
+
+        self.reachable[x, y] = True
+        alive = self.section.materials.alive
+        for reached_x, reached_y in self.flood(cost, [(x, y)]):
+            neighbours = (slice(max(reached_x - 1, 0), reached_x + 2), slice(max(reached_y - 1, 0), reached_y + 2))
+            self.exposed[neighbours] |= alive[neighbours]
+
+    def flood(self, cost, seeds):
+        """ Spreads reachable out from the seed cells, which should already be marked, through passable cells, returning every cell it reached including the seeds """
+        width, height = cost.shape
+        reached = list(seeds)
+        queue = deque(seeds)
+        while len(queue) > 0:
+            x, y = queue.popleft()
+            for neighbour_x in range(max(x - 1, 0), min(x + 2, width)):
+                for neighbour_y in range(max(y - 1, 0), min(y + 2, height)):
+                    if cost[neighbour_x, neighbour_y] > 0 and not self.reachable[neighbour_x, neighbour_y]:
+                        self.reachable[neighbour_x, neighbour_y] = True
+                        reached.append((neighbour_x, neighbour_y))
+                        queue.append((neighbour_x, neighbour_y))
+
+        return reached
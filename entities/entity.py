@@ -14,12 +14,20 @@ class Entity:
         self.bg_color = bg_color
         self.blocks_movement = False
         self.invisible = False
+        self.spatial_index = None
+        self.section = None
 
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
+        old_x, old_y = self.x, self.y
         self.x += dx
         self.y += dy
 
+        if self.spatial_index is not None:
+            self.spatial_index.move(self, old_x, old_y)
+        if self.section is not None:
+            self.section.entity_moved(self)
+
     def update(self):
         pass
 
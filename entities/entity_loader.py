@@ -1,7 +1,8 @@
 
+import numpy as np
 from entities.anchor import Anchor
 from entities.blocker import Blocker
-from entities.material import BlockMaterial, StatueMaterial
+from entities.material_grid import MaterialType
 
 class EntityLoader():
     def __init__(self, engine) -> None:
@@ -10,10 +11,22 @@ class EntityLoader():
 
     def load_entity(self, entity_char, x, y, section):
         if entity_char == ord('#'):
-            section.add_entity(BlockMaterial(self.engine, x, y, section))
+            section.add_material(MaterialType.BLOCK, x, y)
         if entity_char == ord('S'):
-            section.add_entity(StatueMaterial(self.engine, x, y, section))
+            section.add_material(MaterialType.STATUE, x, y)
         elif entity_char == ord('B'):
             section.add_entity(Blocker(self.engine, x, y))
         elif entity_char == ord('A'):
-            section.add_entity(Anchor(self.engine, x, y))
\ No newline at end of file
+            section.add_entity(Anchor(self.engine, x, y))
+
+    def load_entity_layer(self, entity_chars, section):
+        """ Loads every entity in an XP layer's (x, y) indexed char array, adding material a whole type at a time """
+        for char, material_type in ((ord('#'), MaterialType.BLOCK), (ord('S'), MaterialType.STATUE)):
+            xs, ys = np.nonzero(entity_chars == char)
+            if len(xs) > 0:
+                section.add_materials(material_type, xs, ys)
+
+        # Everything else is sparse, so load it cell by cell in row order
+        ys, xs = np.nonzero(np.isin(entity_chars, (ord('B'), ord('A'))).T)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            self.load_entity(entity_chars[x, y], x, y, section)
@@ -0,0 +1,202 @@
+from enum import Enum, IntEnum, auto
+import numpy as np
+import tcod
+from actions.actions import (BlockMaterialChiseled, ChiselMistakeAction,
+                             StatueMaterialChiseled)
+from utils.color import black, marble, marble_highlight, mistake
+
+material_char = 9632
+chiseled_char = 236
+mistake_char = ord('X')
+
+unreachable = np.iinfo(np.int32).max
+
+
+def neighbour_min(values, fill):
+    """ Returns, for every cell, the smallest value among its eight neighbours, treating cells off the edge as fill """
+    width, height = values.shape
+    padded = np.full((width + 2, height + 2), fill, dtype=values.dtype, order="F")
+    padded[1:-1, 1:-1] = values
+
+    result = np.full(values.shape, fill, dtype=values.dtype, order="F")
+    for dx in range(3):
+        for dy in range(3):
+            if dx != 1 or dy != 1:
+                np.minimum(result, padded[dx:dx + width, dy:dy + height], out=result)
+    return result
+
+
+class LeftClickAction(Enum):
+    CARVE = auto()
+    CHISEL = auto()
+
+class MaterialType(IntEnum):
+    NONE = 0
+    BLOCK = auto()
+    STATUE = auto()
+
+
+class MaterialGrid:
+    """
+    All of the statue and block material in a section, stored as arrays indexed by (x, y) rather than as an entity per tile.
+    """
+    def __init__(self, engine, section, width: int, height: int):
+        self.engine = engine
+        self.section = section
+        self.width = width
+        self.height = height
+
+        self.kind = np.zeros((width, height), dtype=np.uint8, order="F")
+        self.alive = np.zeros((width, height), dtype=bool, order="F")
+        self.dying = np.zeros((width, height), dtype=bool, order="F")
+        self.stress = np.zeros((width, height), dtype=np.int32, order="F")
+        self.char = np.zeros((width, height), dtype=np.int32, order="F")
+        self.fg = np.zeros((width, height, 3), dtype=np.uint8, order="F")
+        self.bg = np.zeros((width, height, 3), dtype=np.uint8, order="F")
+
+        self.max_stress = 75
+        self.terminators = [(i, 24) for i in range(12, 27)]
+        self.left_click_action = LeftClickAction.CHISEL
+
+        self.clear()
+
+    def clear(self):
+        self.kind[:] = MaterialType.NONE
+        self.alive[:] = False
+        self.dying[:] = False
+        self.stress[:] = 0
+        self.char[:] = 0
+        self.fg[:] = 0
+        self.bg[:] = 0
+
+        self.initial_bg = marble
+        self.initial_fg = marble_highlight
+
+    def add_material(self, material_type: MaterialType, x: int, y: int):
+        self.kind[x, y] = material_type
+        self.alive[x, y] = True
+        self.dying[x, y] = False
+        self.stress[x, y] = 0
+        self.char[x, y] = material_char
+        self.fg[x, y] = marble
+        self.bg[x, y] = marble_highlight
+
+    def add_materials(self, material_type: MaterialType, xs, ys):
+        """ Vectorised add_material for arrays of coordinates """
+        self.kind[xs, ys] = material_type
+        self.alive[xs, ys] = True
+        self.dying[xs, ys] = False
+        self.stress[xs, ys] = 0
+        self.char[xs, ys] = material_char
+        self.fg[xs, ys] = marble
+        self.bg[xs, ys] = marble_highlight
+
+    def remove_material(self, x: int, y: int):
+        self.kind[x, y] = MaterialType.NONE
+        self.alive[x, y] = False
+        self.dying[x, y] = False
+
+    def is_material(self, x: int, y: int):
+        return 0 <= x < self.width and 0 <= y < self.height and self.alive[x, y]
+
+    def get_type(self, x: int, y: int):
+        if not self.is_material(x, y):
+            return MaterialType.NONE
+        return MaterialType(self.kind[x, y])
+
+    def count(self, material_type: MaterialType):
+        return int(np.count_nonzero(self.alive & (self.kind == material_type)))
+
+    def update(self):
+        """ Adds stress to every piece of material on its shortest path to a terminator, chiseling any with no path or too much stress """
+        if not self.section.board_loaded:
+            return
+
+        # Material blocks movement, so past its first step a path only crosses open cells and the material itself is all that takes stress
+        routed = self.alive & (neighbour_min(self.get_terminator_distances(), unreachable) < unreachable)
+        self.stress[routed] += 1
+
+        failing = self.alive & ~self.dying & (~routed | (self.stress > self.max_stress))
+        for x, y in zip(*np.nonzero(failing)):
+            self.chisel_material(x, y)
+
+    def get_terminator_distances(self):
+        """ Distance from every cell to its nearest terminator over the section's cost grid, found with one multi-source dijkstra pass """
+        cost = self.section.cost
+        distances = np.full(cost.shape, unreachable, dtype=np.int32, order="F")
+        for x, y in self.terminators:
+            if 0 <= x < self.width and 0 <= y < self.height and cost[x, y] > 0:
+                distances[x, y] = 0
+
+        tcod.path.dijkstra2d(distances, cost, 1, 1, out=distances)
+        return distances
+
+    def late_update(self):
+        self.stress[:] = 0
+
+    def render(self, console, x: int, y: int, width: int, height: int, dest_x: int, dest_y: int):
+        """ Draws the living material inside the x, y, width, height region onto console, with the region's corner at dest_x, dest_y """
+        width = min(width, self.width - x, console.width - dest_x)
+        height = min(height, self.height - y, console.height - dest_y)
+        if width <= 0 or height <= 0:
+            return
+
+        alive = self.alive[x:x + width, y:y + height]
+        tiles = console.tiles_rgb[dest_x:dest_x + width, dest_y:dest_y + height]
+        tiles["ch"][alive] = self.char[x:x + width, y:y + height][alive]
+        tiles["fg"][alive] = self.fg[x:x + width, y:y + height][alive]
+        tiles["bg"][alive] = self.bg[x:x + width, y:y + height][alive]
+
+    def mousedown(self, x: int, y: int, button):
+        if not self.is_path_to_anchor(x, y):
+            return
+
+        # Left click chisels statue and right click chisels block, unless carving swaps them round
+        chisel_button = 1 if self.kind[x, y] == MaterialType.STATUE else 3
+        if self.left_click_action == LeftClickAction.CARVE:
+            chisel_button = 4 - chisel_button
+
+        if button == chisel_button:
+            self.chisel_material(x, y)
+        elif button == 1 or button == 3:
+            self.chisel_mistake(x, y)
+
+    def is_path_to_anchor(self, x: int, y: int):
+        if not self.section.board_loaded or self.section.anchor is None:
+            print("Trying to find path but no anchor set!")
+            return False
+
+        return self.section.connectivity.is_exposed(x, y)
+
+    def chisel_material(self, x: int, y: int):
+        self.fg[x, y] = marble
+        self.bg[x, y] = black
+        self.char[x, y] = chiseled_char
+        self.dying[x, y] = True
+
+        if self.kind[x, y] == MaterialType.STATUE:
+            action = StatueMaterialChiseled(self.engine, self.section, x, y)
+        else:
+            action = BlockMaterialChiseled(self.engine, self.section, x, y)
+        self.engine.scheduler.call_later(0.1, action.perform)
+
+    def chisel_mistake(self, x: int, y: int):
+        if not self.dying[x, y]:
+            self.fg[x, y] = mistake
+            self.bg[x, y] = black
+            self.char[x, y] = mistake_char
+            ChiselMistakeAction(self.engine, self.section).perform()
+            self.engine.scheduler.call_later(0.3, self.reset_tile, x, y)
+
+    def reset_tile(self, x: int, y: int):
+        if self.alive[x, y]:
+            self.fg[x, y] = self.initial_fg
+            self.bg[x, y] = self.initial_bg
+            self.char[x, y] = material_char
+
+    def set_initial_colors(self, initial_bg, initial_fg):
+        self.bg[self.alive] = initial_bg
+        self.fg[self.alive] = initial_fg
+
+        self.initial_bg = initial_bg
+        self.initial_fg = initial_fg
@@ -1,4 +1,5 @@
-
+import numpy as np
+import tile_types
 from image import Image
 
 class Font():
@@ -21,3 +22,18 @@ class Font():
             return self.font_image.tiles[index : index + self.char_width, 0 : self.char_height]["graphic"]
         if char == ord('-'):
             return self.font_image.tiles[30 : 30 + self.char_width, 0 : self.char_height]["graphic"]
+
+    def rasterize(self, text, spacing=0):
+        """ Lays text out left to right as a single graphic_dt block, with spacing blank columns between each character """
+        width = max(len(text) * (self.char_width + spacing) - spacing, 0)
+        tiles = np.full((width, self.char_height), fill_value=tile_types.blank_graphic, order="F")
+
+        for i, char in enumerate(text):
+            glyph = self.get_character(char)
+            if glyph is not None:
+                start_x = i * (self.char_width + spacing)
+                tiles[start_x:start_x + self.char_width] = glyph
+
+        # Shared by everything that asks the FontManager for this text, so nobody gets to draw on it
+        tiles.flags.writeable = False
+        return tiles
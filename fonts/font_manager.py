@@ -1,11 +1,34 @@
+from collections import OrderedDict
+
 from fonts.font import Font
 
 class FontManager():
-    def __init__(self):
+    def __init__(self, max_cached_text=64):
         self.fonts = {}
 
+        # Rasterized strings keyed by (font, text, spacing), least recently used first
+        self.text_cache = OrderedDict()
+        self.max_cached_text = max_cached_text
+
     def add_font(self, fontname):
         self.fonts[fontname] = Font(fontname)
+        for key in [key for key in self.text_cache if key[0] == fontname]:
+            del self.text_cache[key]
 
     def get_font(self, fontname):
-        return self.fonts[fontname]
\ No newline at end of file
+        return self.fonts[fontname]
+
+    def get_text(self, fontname, text, spacing=0):
+        """ Returns text rasterized in the font as a read only graphic_dt block, only laying it out the first time it's asked for """
+        key = (fontname, text, spacing)
+        tiles = self.text_cache.get(key)
+        if tiles is not None:
+            self.text_cache.move_to_end(key)
+            return tiles
+
+        tiles = self.get_font(fontname).rasterize(text, spacing)
+        self.text_cache[key] = tiles
+        while len(self.text_cache) > self.max_cached_text:
+            self.text_cache.popitem(last=False)
+
+        return tiles
@@ -0,0 +1,91 @@
+import time
+
+
+class FixedTimestepLoop():
+    """
+    Drives the engine on a fixed timestep instead of on every vsync, so the simulation runs at the same rate whatever the
+    display refreshes at. Wall time is banked in an accumulator and spent in whole frames of step / renders_per_step,
+    simulating once every renders_per_step frames with a dt of exactly step. Effects and fades advance as they're
+    rendered, so every frame is rendered even when catching up, but only the last one of a catch-up is presented.
+    """
+    def __init__(self, engine, step: float = 1 / 30, renders_per_step: int = 2, max_catch_up_frames: int = 8, unlimited: bool = False, clock=time.perf_counter):
+        self.engine = engine
+        self.step = step
+        self.renders_per_step = renders_per_step
+        self.frame_time = step / renders_per_step
+        self.max_catch_up_frames = max_catch_up_frames
+        # Run frames back to back as fast as they'll go rather than in real time, e.g. headless
+        self.unlimited = unlimited
+        self.clock = clock
+
+        self.accumulator = 0.0
+        self.last_time = None
+        self.frame_index = 0
+
+        # Seconds the last frame spent in update, in rendering and handling events, and in late_update
+        self.phase_times = (0.0, 0.0, 0.0)
+
+    def run_frame(self, handle_events) -> bool:
+        """ Runs one frame, returning whether the frame changed and needs presenting """
+        simulating = self.frame_index % self.renders_per_step == 0
+        self.frame_index += 1
+
+        start = time.perf_counter()
+        if simulating:
+            self.engine.update()
+        update_end = time.perf_counter()
+
+        needs_present = self.engine.compose_frame()
+        handle_events()
+        render_end = time.perf_counter()
+
+        if simulating:
+            self.engine.late_update()
+        end = time.perf_counter()
+
+        self.phase_times = (update_end - start, render_end - update_end, end - render_end)
+        return needs_present
+
+    def advance(self) -> int:
+        """ Banks the wall time since the last call and returns how many whole frames are due """
+        if self.unlimited:
+            return 1
+
+        now = self.clock()
+        if self.last_time is None:
+            self.last_time = now - self.frame_time
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        # After a stall, drop the time that can't be caught up on rather than spiralling trying to simulate all of it
+        self.accumulator = min(self.accumulator, self.frame_time * self.max_catch_up_frames)
+
+        frames = int(self.accumulator / self.frame_time)
+        self.accumulator -= frames * self.frame_time
+        return frames
+
+    def time_until_next_frame(self) -> float:
+        if self.unlimited:
+            return 0
+        return max(self.frame_time - self.accumulator - (self.clock() - self.last_time), 0)
+
+    def tick(self, present, handle_events):
+        """ Runs every frame that's due, presenting the last one if anything in it changed, then waits for the next """
+        frames = self.advance()
+
+        needs_present = False
+        for _ in range(frames):
+            needs_present = self.run_frame(handle_events) or needs_present
+
+        if needs_present:
+            present(self.engine.compositor.frame)
+        if frames > 0:
+            self.engine.delta_time.record_frame()
+
+        wait = self.time_until_next_frame()
+        if wait > 0:
+            time.sleep(wait)
+
+    def run(self, present, handle_events):
+        while True:
+            self.tick(present, handle_events)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Must be set before pygame opens the mixer, so sounds and music play into a null device rather than needing real audio hardware
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from application_path import get_app_path
+
+# Assets are loaded relative to the game's own directory, some of them as modules are imported. Paths given on the command line
+# are still relative to wherever it was launched from
+launch_directory = os.getcwd()
+os.chdir(get_app_path())
+
+import numpy as np
+import tcod.event
+
+from engine import GameState
+from game_loop import FixedTimestepLoop
+from hercules_game import HerculesGame
+from utils.delta_time import FixedDeltaTime
+
+
+class NullMusic():
+    """ Stands in for pygame.mixer.music, so music never needs loading from disk or a device to stream to """
+    def __init__(self):
+        self.playing = False
+
+    def load(self, filename):
+        pass
+
+    def play(self):
+        self.playing = True
+
+    def fadeout(self, time):
+        self.playing = False
+
+    def get_busy(self):
+        return self.playing
+
+    def set_volume(self, volume):
+        pass
+
+
+class FrameTiming():
+    def __init__(self, update, render, late_update):
+        self.update = update
+        self.render = render
+        self.late_update = late_update
+        self.total = update + render + late_update
+
+
+class FrameAllocations():
+    def __init__(self, peak_bytes, net_blocks):
+        # How far memory climbed above where it started during the frame, i.e. what the frame allocated and threw away
+        self.peak_bytes = peak_bytes
+        # Memory blocks still held once the frame was done
+        self.net_blocks = net_blocks
+
+
+class HeadlessRunner():
+    """
+    Runs HerculesGame through the same fixed timestep loop as the game, unlimited so frames run back to back, against the
+    compositor's offscreen console with no window, a null audio device and a synthetic clock that advances by step every
+    simulation step, recording how long each part of every frame took and how long each level load took.
+    """
+    def __init__(self, screen_width: int = 51, screen_height: int = 30, step: float = 1 / 30, renders_per_step: int = 2, save_path: str = None):
+        if save_path is None:
+            # A throwaway save, so a run never touches the player's own
+            self.save_directory = tempfile.TemporaryDirectory(prefix="hercules_headless")
+            save_path = os.path.join(self.save_directory.name, "game_save.json")
+
+        self.engine = HerculesGame(save_path, screen_width, screen_height, FixedDeltaTime(step), NullMusic())
+        self.loop = FixedTimestepLoop(self.engine, step, renders_per_step, unlimited=True)
+        self.frame_timings = list()
+        self.frame_allocations = list()
+        self.presented_frames = 0
+        # Level loads happen between frames, so they're timed on their own rather than as part of one
+        self.load_times = list()
+
+    def run_frame(self):
+        """ Runs one frame, also recording what it allocated if tracemalloc is tracing """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            start_blocks = sys.getallocatedblocks()
+
+        # Input is fed in between frames by click, so there are no events to handle during one
+        if self.loop.run_frame(lambda: None):
+            self.presented_frames += 1
+
+        self.frame_timings.append(FrameTiming(*self.loop.phase_times))
+
+        if tracing:
+            self.frame_allocations.append(FrameAllocations(tracemalloc.get_traced_memory()[1] - start_bytes, sys.getallocatedblocks() - start_blocks))
+
+    def run(self, frames: int):
+        for _ in range(frames):
+            self.run_frame()
+
+    def run_for(self, seconds: float):
+        """ Runs enough frames for seconds of game time to pass """
+        self.run(math.ceil(seconds / self.loop.frame_time))
+
+    def run_until(self, condition, max_frames: int):
+        """ Runs frames until condition() is true, giving up after max_frames. Returns whether condition was met """
+        for _ in range(max_frames):
+            if condition():
+                return True
+            self.run_frame()
+
+        return condition()
+
+    def click(self, x: int, y: int, button: tcod.event.MouseButton = tcod.event.MouseButton.LEFT):
+        """ Presses and releases a mouse button over a tile, going through the same event handler a real click would """
+        self.engine.mouse_location = (x, y)
+        for event in (tcod.event.MouseButtonDown(tile=(x, y), button=button), tcod.event.MouseButtonUp(tile=(x, y), button=button)):
+            actions = self.engine.event_handler.dispatch(event)
+            for action in actions or []:
+                action.perform()
+
+    def skip_intro(self):
+        # The curtain effect starts from whatever was last drawn, so there needs to have been a frame already
+        self.engine.compose_frame()
+        self.engine.end_intro()
+
+    def start_level(self, stage_index: int, level_index: int):
+        """ Loads a level straight away, skipping the intro, the menu and the curtain effect that normally leads into the level """
+        menu = self.engine.menu_sections["Menu"]
+        menu.selected_stage_index = stage_index
+
+        self.engine.stage = menu.get_selected_stage()
+        self.engine.level = menu.stages[stage_index]["levels"][level_index]
+        self.engine.change_state(GameState.IN_GAME)
+
+        start = time.perf_counter()
+        self.engine.load_level()
+        self.load_times.append(time.perf_counter() - start)
+
+    def get_frame(self):
+        """ The last composed frame """
+        return self.engine.compositor.frame
+
+    def get_report(self):
+        report = dict()
+        report["frames"] = len(self.frame_timings)
+        report["presented_frames"] = self.presented_frames
+
+        for phase in ("update", "render", "late_update", "total"):
+            times = [getattr(timing, phase) for timing in self.frame_timings]
+            if len(times) > 0:
+                report[phase] = get_time_stats(times)
+
+        if len(self.load_times) > 0:
+            report["loads"] = len(self.load_times)
+            report["load"] = get_time_stats(self.load_times)
+
+        if len(self.frame_allocations) > 0:
+            peak_kib = np.array([allocations.peak_bytes for allocations in self.frame_allocations]) / 1024
+            net_blocks = np.array([allocations.net_blocks for allocations in self.frame_allocations])
+            report["allocations"] = {
+                "mean_peak_kib": float(np.mean(peak_kib)),
+                "p95_peak_kib": float(np.percentile(peak_kib, 95)),
+                "max_peak_kib": float(np.max(peak_kib)),
+                "mean_net_blocks": float(np.mean(net_blocks)),
+                "total_net_blocks": int(np.sum(net_blocks)),
+            }
+
+        return report
+
+
+def get_time_stats(times):
+    """ Mean, p50, p95, p99 and max of a list of times in seconds, in milliseconds """
+    times = np.array(times) * 1000
+    return {
+        "mean_ms": float(np.mean(times)),
+        "p50_ms": float(np.percentile(times, 50)),
+        "p95_ms": float(np.percentile(times, 95)),
+        "p99_ms": float(np.percentile(times, 99)),
+        "max_ms": float(np.max(times)),
+    }
+
+
+def print_report(report):
+    print("frames: " + str(report["frames"]) + " (" + str(report["presented_frames"]) + " presented)")
+    for phase in ("load", "update", "render", "late_update", "total"):
+        if phase in report:
+            stats = report[phase]
+            print("{:<12} mean {:8.3f}ms  p50 {:8.3f}ms  p95 {:8.3f}ms  p99 {:8.3f}ms  max {:8.3f}ms".format(
+                phase, stats["mean_ms"], stats["p50_ms"], stats["p95_ms"], stats["p99_ms"], stats["max_ms"]))
+    if "allocations" in report:
+        stats = report["allocations"]
+        print("{:<12} mean peak {:8.1f}KiB  p95 peak {:8.1f}KiB  net blocks {:d}".format(
+            "allocations", stats["mean_peak_kib"], stats["p95_peak_kib"], stats["total_net_blocks"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Runs the game without a window or audio device and reports per frame timings.")
+    parser.add_argument("--frames", type=int, default=300, help="number of frames to run")
+    parser.add_argument("--step", type=float, default=1 / 30, help="seconds the synthetic clock advances each simulation step")
+    parser.add_argument("--renders-per-step", type=int, default=2, help="frames rendered for each simulation step")
+    parser.add_argument("--skip-intro", action="store_true", help="go straight to the menu")
+    parser.add_argument("--level", type=int, nargs=2, metavar=("STAGE", "LEVEL"), help="load this stage and level index before running")
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(step=args.step, renders_per_step=args.renders_per_step)
+    if args.level is not None:
+        runner.start_level(args.level[0], args.level[1])
+    elif args.skip_intro:
+        runner.skip_intro()
+
+    runner.run(args.frames)
+    print_report(runner.get_report())
+
+
+if __name__ == "__main__":
+    main()
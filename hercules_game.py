@@ -1,13 +1,11 @@
 import json
-from threading import Timer
-
-from pygame import mixer
 
 from engine import Engine, GameState
+from utils.delta_time import DeltaTime
 
 class HerculesGame(Engine):
-    def __init__(self, save_path, teminal_width: int, terminal_height: int):
-        super().__init__(save_path, teminal_width, terminal_height)
+    def __init__(self, save_path, teminal_width: int, terminal_height: int, delta_time: DeltaTime = None, music = None):
+        super().__init__(save_path, teminal_width, terminal_height, delta_time, music)
 
     def create_new_save_data(self):
         super().create_new_save_data()
@@ -53,14 +51,18 @@ class HerculesGame(Engine):
         self.enable_section("statueSection")
         self.game_sections["statueSection"].load_level(self.stage, self.level)
 
+    def prefetch_level(self, stage, level):
+        self.game_sections["statueSection"].prefetch_level(stage, level)
+
     def select_level(self, stage, level): 
-        mixer.music.fadeout(1000)
+        self.prefetch_level(stage, level)
+        self.music.fadeout(1000)
         self.playing_menu_music = False
         self.change_state(GameState.IN_GAME)
         self.full_screen_effect.start()
         self.stage = stage
         self.level = level
-        Timer(2,self.load_level).start()
+        self.scheduler.call_later(2, self.load_level)
 
     def level_complete(self, summary):
         self.open_summary_section(summary)
@@ -9,13 +9,30 @@ if TYPE_CHECKING:
     from engine import Engine
 
 
+def drain_events():
+    """
+    Takes everything waiting in the event queue at once, collapsing each run of back to back mouse motion into its last event.
+    Motion just before a button or key event is kept, so clicks still land where the cursor was when they happened.
+    """
+    events = list()
+    for event in tcod.event.get():
+        if isinstance(event, tcod.event.MouseMotion) and len(events) > 0 and isinstance(events[-1], tcod.event.MouseMotion):
+            events[-1] = event
+        else:
+            events.append(event)
+
+    return events
+
+
 class EventHandler(tcod.event.EventDispatch[Action]):
     def __init__(self, engine: Engine):
         self.engine = engine
         self.current_context = None
 
     def handle_events(self, context: tcod.context.Context, discard_events: bool) -> None:
-        for event in tcod.event.get():
+        for event in drain_events():
+            if isinstance(event, tcod.event.WindowEvent):
+                self.on_window_event(event)
 
             if discard_events == True:
                 continue
@@ -23,6 +40,15 @@ class EventHandler(tcod.event.EventDispatch[Action]):
             context.convert_event(event)
             self.dispatch(event)
 
+    def on_window_event(self, event: tcod.event.WindowEvent) -> None:
+        self.engine.compositor.invalidate()
+
+        # Nothing can be seen while minimized, so hold game time rather than let effects and the level play out unwatched
+        if event.type == "WindowMinimized":
+            self.engine.pause_time()
+        elif event.type == "WindowRestored":
+            self.engine.resume_time()
+
     def ev_quit(self, event: tcod.event.Quit) -> None:
         self.engine.quit()
 
@@ -33,7 +59,9 @@ class EventHandler(tcod.event.EventDispatch[Action]):
 class MainGameEventHandler(EventHandler):
     def handle_events(self, context: tcod.context.Context, discard_events: bool) -> None:
         self.current_context = context
-        for event in tcod.event.get():
+        for event in drain_events():
+            if isinstance(event, tcod.event.WindowEvent):
+                self.on_window_event(event)
 
             if discard_events == True:
                 continue
@@ -61,8 +89,12 @@ class MainGameEventHandler(EventHandler):
 
     def ev_mousemotion(self, event: tcod.event.MouseMotion) -> None:
 
-        self.engine.mouse_location = self.current_context.pixel_to_tile(
-            event.pixel.x, event.pixel.y)
+        mouse_location = tuple(self.current_context.pixel_to_tile(event.pixel.x, event.pixel.y))
+        # Nothing under the cursor changes until it crosses into another tile
+        if mouse_location == tuple(self.engine.mouse_location):
+            return
+
+        self.engine.mouse_location = mouse_location
 
         for _, section in self.engine.get_active_ui_sections():
             if section.ui is not None:
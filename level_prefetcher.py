@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class PrefetchedLevel():
+    def __init__(self, xp_data, complete_sound, start_sound):
+        self.xp_data = xp_data
+        self.complete_sound = complete_sound
+        self.start_sound = start_sound
+
+
+class LevelPrefetcher():
+    """
+    Decodes a level's tiles, entity layer and stage sounds on a worker thread and keeps the last few in an LRU cache,
+    so the load that follows the curtain effect doesn't stall the render loop.
+    """
+    def __init__(self, section, max_levels=3):
+        self.section = section
+        self.max_levels = max_levels
+        self.levels = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level_prefetch")
+
+    def prefetch(self, stage, level):
+        key = self.get_key(stage, level)
+        with self.lock:
+            if key in self.levels:
+                self.levels.move_to_end(key)
+                return self.levels[key]
+
+            future = self.executor.submit(self.load, stage, level)
+            self.levels[key] = future
+            while len(self.levels) > self.max_levels:
+                self.levels.popitem(last=False)
+
+            return future
+
+    def get(self, stage, level):
+        """ Returns the level's assets, waiting on (or starting) the worker thread if they aren't ready yet """
+        return self.prefetch(stage, level).result()
+
+    def load(self, stage, level):
+        xp_data = self.section.load_xp_data(level["file"])
+
+        # Pull the layers out of any memory mapped cache now, rather than page faulting on the main thread later
+        xp_data['layer_data'] = [np.array(layer, order="F") for layer in xp_data['layer_data']]
+
+        complete_sound = None
+        start_sound = None
+        if stage["ending_music"] != "" and stage["start_music"] != "":
+            complete_sound = self.section.validate_sound('Sounds/' + stage["ending_music"])
+            start_sound = self.section.validate_sound('Sounds/' + stage["start_music"])
+
+        return PrefetchedLevel(xp_data, complete_sound, start_sound)
+
+    def get_key(self, stage, level):
+        return (level["file"], stage["ending_music"], stage["start_music"])
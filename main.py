@@ -6,7 +6,17 @@ import tcod
 from appdirs import *
 
 from application_path import get_app_path
+from game_loop import FixedTimestepLoop
 from hercules_game import HerculesGame
+from utils.delta_time import FixedDeltaTime
+
+
+# The game simulates at a fixed rate and renders twice per simulation step, whatever the display's refresh rate
+simulation_step = 1 / 30
+renders_per_step = 2
+
+# The loop paces frames itself, so vsync only stops tearing. Turning it off leaves the loop's own frame cap
+vsync = True
 
 
 def main() -> None:
@@ -49,31 +59,16 @@ def main() -> None:
         terminal_height,
         tileset=tileset,
         title="The Farnese Hercules",
-        vsync=True,
+        vsync=vsync,
         sdl_window_flags=window_flags
     ) as root_context:
 
         tcod.lib.SDL_SetHint(b"SDL_RENDER_SCALE_QUALITY", b"0")
 
-        root_console = tcod.Console(screen_width, screen_height, order="F")
-        engine = HerculesGame(save_path, screen_width, screen_height)
-
-        cycle = 0
-        while True:
-            cycle += 1
-            if cycle % 2 == 0:
-                engine.update()
-
-            root_console.clear()
-
-            engine.event_handler.on_render(root_console=root_console)
-
-            root_context.present(root_console)
-
-            engine.handle_events(root_context)
+        engine = HerculesGame(save_path, screen_width, screen_height, FixedDeltaTime(simulation_step))
 
-            if cycle % 2 == 0:
-                engine.late_update()
+        loop = FixedTimestepLoop(engine, simulation_step, renders_per_step)
+        loop.run(root_context.present, lambda: engine.handle_events(root_context))
 
 
 if __name__ == "__main__":
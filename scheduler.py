@@ -0,0 +1,60 @@
+import heapq
+import itertools
+
+
+class ScheduledCall():
+    def __init__(self, due: float, interval: float, callback, args):
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler():
+    """
+    Runs delayed and repeating callbacks on the main thread as game time passes, in place of threading.Timer.
+    Time only moves when update is called with the frame's delta time, so callbacks never race with rendering
+    and fire at the same point in a run every time it's played back with the same frame times.
+    """
+    def __init__(self):
+        self.time = 0.0
+        # Heap of (due, sequence, call), sequence keeping calls due at the same time in the order they were made
+        self.calls = list()
+        self.sequence = itertools.count()
+
+    def call_later(self, delay: float, callback, *args) -> ScheduledCall:
+        """ Calls callback(*args) once delay seconds of game time have passed """
+        return self.push(ScheduledCall(self.time + delay, None, callback, args))
+
+    def call_every(self, interval: float, callback, *args) -> ScheduledCall:
+        """ Calls callback(*args) every interval seconds of game time until it's cancelled """
+        if interval <= 0:
+            raise ValueError("Repeating calls need an interval greater than 0, got " + str(interval))
+
+        return self.push(ScheduledCall(self.time + interval, interval, callback, args))
+
+    def push(self, call: ScheduledCall) -> ScheduledCall:
+        heapq.heappush(self.calls, (call.due, next(self.sequence), call))
+        return call
+
+    def update(self, delta_time: float):
+        """ Moves game time on and runs everything that has come due, in the order it was due """
+        self.time += delta_time
+
+        while len(self.calls) > 0 and self.calls[0][0] <= self.time:
+            _, _, call = heapq.heappop(self.calls)
+            if call.cancelled:
+                continue
+
+            if call.interval is not None:
+                call.due += call.interval
+                self.push(call)
+
+            call.callback(*call.args)
+
+    def clear(self):
+        self.calls.clear()
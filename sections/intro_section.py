@@ -1,5 +1,4 @@
 
-import copy
 import json
 from enum import Enum, auto
 
@@ -9,7 +8,8 @@ from actions.actions import (IntroEndAction, PlayMenuMusicAction,
                              PlayMusicFileAction)
 from image import Image
 from tcod import Console
-from utils.color import blend_colour
+from utils.color import black, blend_colour
+from utils.fade import blend_tiles
 from utils.utils import translate_range
 
 from sections.section import Section
@@ -117,17 +117,13 @@ class IntroSection(Section):
                 elif self.time_into_splash > splash.outro_start:
                     t = translate_range(self.time_into_splash, splash.outro_start,  splash.outro_end, 0, 1)
 
-                for w in range(0, console.width):
-                    for h in range(0, self.height):
-                        new_tile =  copy.copy(splash.image.tiles[w,h]["graphic"])
-                        if self.time_into_splash < splash.intro:
-                            new_tile[1] = blend_colour(new_tile[1], (0,0,0), t)
-                            new_tile[2] = blend_colour(new_tile[2], (0,0,0), t)
-                        elif self.time_into_splash > splash.outro_start:
-                            new_tile[1] = blend_colour((0,0,0), new_tile[1],  t)
-                            new_tile[2] = blend_colour((0,0,0), new_tile[2],  t)
-
-                        console.tiles_rgb[w,h] = new_tile
+                image_tiles = splash.image.tiles[0:console.width, 0:self.height]["graphic"]
+                if self.time_into_splash < splash.intro:
+                    image_tiles = blend_tiles(image_tiles, black, t)
+                elif self.time_into_splash > splash.outro_start:
+                    image_tiles = blend_tiles(image_tiles, black, 1 - t)
+
+                console.tiles_rgb[0:console.width, 0:self.height] = image_tiles
             elif splash.type == IntroSplashType.BLANK:
                 pass
             
@@ -1,9 +1,9 @@
 
 import copy
-import json
 from enum import Enum, auto
 from math import sqrt
 
+import asset_bundle
 import numpy as np
 import tcod
 from actions.actions import EscapeAction, SelectLevelAction
@@ -37,11 +37,10 @@ class MenuSection(Section):
 
         self.stage_tiles = []
         levels_path = "game_data/levels_demo.json" if self.engine.is_demo() else "game_data/levels.json"
-        with open ( levels_path ) as f:
-            data = json.load(f)
-            for stage in data["stages"]:
-                self.stages.append(stage)
-                self.stage_tiles.append(self.load_xp_data(stage["background"]))
+        data = asset_bundle.load_json(levels_path)
+        for stage in data["stages"]:
+            self.stages.append(stage)
+            self.stage_tiles.append(self.load_xp_data(stage["background"]))
 
         self.stage_ui = MenuStageUI(self, self.tiles["graphic"])
 
@@ -124,9 +123,11 @@ class MenuSection(Section):
             if key == tcod.event.K_UP:
                     self.selected_level -= 1
                     self.selected_level = max(0, self.selected_level)
+                    self.prefetch_selected_level()
             elif key == tcod.event.K_DOWN:
                     self.selected_level += 1
                     self.selected_level = min(len(self.stages[self.selected_stage_index]["levels"]) - 1, self.selected_level)
+                    self.prefetch_selected_level()
             elif key == tcod.event.K_RIGHT:
                     if self.selected_stage_index < len(self.stages) - 1:
                         self.change_stage(self.selected_stage_index + 1)
@@ -149,19 +150,28 @@ class MenuSection(Section):
             return
 
         self.selected_level = level_index
+        self.prefetch_selected_level()
 
     def select_level(self,level_index):
         if level_index >= len( self.stages[self.selected_stage_index]["levels"]):
             return
 
         if self.can_play_level(level_index):
-            stage = {}
-            stage["name"] = self.stages[self.selected_stage_index]["name"]
-            stage["ending_music"] = self.stages[self.selected_stage_index]["ending_music"]
-            stage["start_music"] = self.stages[self.selected_stage_index]["start_music"]
-            stage["start_length"] = self.stages[self.selected_stage_index]["start_length"]
-            stage["end_length"] = self.stages[self.selected_stage_index]["end_length"]
-            SelectLevelAction(self.engine, stage, self.stages[self.selected_stage_index]["levels"][level_index]).perform()
+            SelectLevelAction(self.engine, self.get_selected_stage(), self.stages[self.selected_stage_index]["levels"][level_index]).perform()
+
+    def prefetch_selected_level(self):
+        #Start decoding the level the player is most likely to pick next, so loading it after the curtain is instant
+        if self.can_play_level(self.selected_level):
+            self.engine.prefetch_level(self.get_selected_stage(), self.stages[self.selected_stage_index]["levels"][self.selected_level])
+
+    def get_selected_stage(self):
+        stage = {}
+        stage["name"] = self.stages[self.selected_stage_index]["name"]
+        stage["ending_music"] = self.stages[self.selected_stage_index]["ending_music"]
+        stage["start_music"] = self.stages[self.selected_stage_index]["start_music"]
+        stage["start_length"] = self.stages[self.selected_stage_index]["start_length"]
+        stage["end_length"] = self.stages[self.selected_stage_index]["end_length"]
+        return stage
 
     def delta_change_stage(self, delta):
         self.change_stage(self.selected_stage_index + delta)
@@ -190,6 +200,7 @@ class MenuSection(Section):
             level_name_pos[0] += 9
             level_name_pos[1] -= 1
         self.ui.setup_level_buttons(level_name_pos, self.engine.is_demo())
+        self.prefetch_selected_level()
 
     def change_state(self, new_state):
         if new_state == MenuState.MAIN:
@@ -211,6 +222,7 @@ class MenuSection(Section):
                 level_name_pos[0] += 9
                 level_name_pos[1] -= 1
             self.ui.setup_level_buttons(level_name_pos, self.engine.is_demo())
+            self.prefetch_selected_level()
 
             if self.state == MenuState.MAIN:
                 self.transition_effect.start(HorizontalWipeDirection.LEFT)
@@ -1,14 +1,14 @@
-import gzip
 import os
 import random
 from math import sqrt
 
+import asset_cache
 import numpy as np
 import tile_types
-import xp_loader
 from entities.entity import Entity
 from entities.entity_loader import EntityLoader
 from pygame import mixer, sndarray
+from utils.spatial_index import SpatialIndex
 
 
 class Section:
@@ -22,6 +22,8 @@ class Section:
         
         self.entity_loader = EntityLoader(self.engine)
         self.entities = []
+        self.entity_index = SpatialIndex(self.width, self.height)
+        self.bulk_loading = False
 
         tile = tile_types.background_tile
         tile["graphic"]["bg"] = (random.randint(0,255),random.randint(0,255),random.randint(0,255))
@@ -36,39 +38,33 @@ class Section:
 
     def load_xp_data(self, filepath):
         if filepath:
-            xp_file = gzip.open("images/" + filepath)
-            raw_data = xp_file.read()
-            xp_file.close()
-            return xp_loader.load_xp_string(raw_data)
+            return asset_cache.load_xp_file("images/" + filepath)
 
     def load_tiles(self, data_name, xp_data):
         if xp_data is not None:
             self.loaded_tiles = data_name
-            for h in range(0, self.height):
-                if h < xp_data['height']:
-                    for w in range(0, self.width):
-                        if w < xp_data['width']:
-                            self.tiles[w, h]['walkable'] = True
-                            self.tiles[w, h]['graphic'] = xp_data['layer_data'][0]['cells'][w][h]
-                        else:
-                            break
-                else:
-                    break
+            width = min(self.width, xp_data['width'])
+            height = min(self.height, xp_data['height'])
+            self.tiles['walkable'][0:width, 0:height] = True
+            self.tiles['graphic'][0:width, 0:height] = xp_data['layer_data'][0][0:width, 0:height]
 
     def load_entities(self, data_name, xp_data):
         if xp_data is not None:
-            if len(xp_data['layer_data']) > 1 != None:
+            if len(xp_data['layer_data']) > 1:
                 self.loaded_tiles = data_name
-                for h in range(0, self.height):
-                    if h < xp_data['height']:
-                        for w in range(0, self.width):
-                            if w < xp_data['width']:
-                                self.entity_loader.load_entity(xp_data['layer_data'][1]['cells'][w][h][0], w, h, self)
-                                pass
-                            else:
-                                break
-                    else:
-                        break
+                width = min(self.width, xp_data['width'])
+                height = min(self.height, xp_data['height'])
+
+                self.begin_bulk_load()
+                self.entity_loader.load_entity_layer(xp_data['layer_data'][1]['ch'][0:width, 0:height], self)
+                self.commit_bulk_load()
+
+    def begin_bulk_load(self):
+        """ Until commit_bulk_load is called, adding entities and material skips any per-item bookkeeping """
+        self.bulk_loading = True
+
+    def commit_bulk_load(self):
+        self.bulk_loading = False
 
     def render(self, console):
         if len(self.tiles) > 0:
@@ -103,17 +99,34 @@ class Section:
     def remove_entity(self, entity):
         if entity in self.entities:
             self.entities.remove(entity)
+            self.entity_index.remove(entity)
+            entity.section = None
 
     def get_entities_at_location(self, x: int, y: int):
-        entities = list()
-        for entity in self.entities:
-            if entity.x == x and entity.y == y:
-                entities.append(entity)
+        return self.entity_index.get(x, y)
 
-        return entities
+    def get_entities_at_locations(self, locations):
+        return self.entity_index.get_many(locations)
 
     def add_entity(self, entity):
         self.entities.append(entity)
+        self.entity_index.add(entity)
+        entity.section = self
+
+    def entity_moved(self, entity):
+        pass
+
+    def clear_entities(self):
+        for entity in self.entities:
+            entity.section = None
+        self.entities.clear()
+        self.entity_index.clear()
+
+    def add_material(self, material_type, x, y):
+        pass
+
+    def add_materials(self, material_type, xs, ys):
+        pass
 
     def is_point_in_section(self, x,y):
         return (x >= 0) and (x < self.width) and (y >= 0) and (y < self.height)
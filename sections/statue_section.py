@@ -1,10 +1,7 @@
 
-import copy
 import enum
 import random
 from enum import Enum, auto
-from math import sqrt
-from threading import Timer
 
 import numpy as np
 import tcod
@@ -20,13 +17,18 @@ from effects.vertical_move_effect import (VerticalMoveDirection,
 from effects.vertical_wipe_effect import (VerticalWipeDirection,
                                           VerticalWipeEffect)
 from entities.anchor import Anchor
+from entities.anchor_connectivity import AnchorConnectivity
 from entities.blocker import Blocker
-from entities.material import BlockMaterial, Material, StatueMaterial
+from entities.material_grid import MaterialGrid, MaterialType
+from level_prefetcher import LevelPrefetcher
 from pygame import mixer
 from tcod import Console
 from ui.statue_ended_ui import StatueEndedUI
-from utils.color import black, spot_line, blend_colour, blend_colour_with_alpha
-from utils.utils import translate_range
+from utils.color import black, spot_line
+from utils.console_pool import console_pool
+from utils.fade import blend_tiles
+from utils.spotting_ray import SpottingRay
+from utils.utils import blit_tiles, translate_range
 
 from sections.section import Section
 
@@ -49,6 +51,11 @@ class SpottingLineType(Enum):
 
 class StatueSection(Section):
     def __init__(self, engine, x: int, y: int, width: int, height: int, xp_filepath: str = ""):
+        self.materials = MaterialGrid(engine, self, width, height)
+        self.connectivity = AnchorConnectivity(self)
+        self.spotting_ray = SpottingRay(self)
+        self.board_version = 0
+
         super().__init__(engine, x, y, width, height, xp_filepath=xp_filepath)      
 
         self.max_spotted_material_tiles = 3
@@ -56,7 +63,7 @@ class StatueSection(Section):
         self.state_speed = 10
         self.reset()              
 
-        self.update_graph()
+        self.update_cost()
 
         self.statue_ended_ui = StatueEndedUI(self)
 
@@ -67,6 +74,8 @@ class StatueSection(Section):
 
         self.spotting_line_type = SpottingLineType.EIGHT_POINTS
 
+        self.level_prefetcher = LevelPrefetcher(self)
+
     def reset(self):
         self.mousedown_point = None
         self.spotting = False
@@ -77,7 +86,7 @@ class StatueSection(Section):
         self.remaining_statue = 0
         self.faults = 0
         self.anchor = None
-        self.graph = None
+        self.board_loaded = False
         self.level = None
         self.state = StatueState.INACTIVE
         self.summary = None
@@ -96,7 +105,13 @@ class StatueSection(Section):
 
         self.name_char_probabilites = []
 
-        self.entities.clear()
+        self.clear_entities()
+        self.materials.clear()
+        self.connectivity.mark_dirty()
+        self.board_version += 1
+
+        self.static_layer = None
+        self.static_mask = None
 
         self.stage = None
 
@@ -112,6 +127,10 @@ class StatueSection(Section):
 
     def update(self):
         self.update_spotting_line()
+
+    def late_update(self):
+        super().late_update()
+        self.materials.late_update()
     
     def render(self, console):
         if self.state == StatueState.LOAD_FOOTER:
@@ -145,7 +164,7 @@ class StatueSection(Section):
             temp_console = Console(width=self.width, height=self.footer_height, order="F")
             temp_console.tiles_rgb[0 :self.width, 0: self.footer_height] = self.tiles[0 :self.width, self.footer_y: self.footer_y + self.footer_height]["graphic"]
 
-            self.load_footer_effect.tiles = temp_console.tiles
+            self.load_footer_effect.set_tiles(temp_console.tiles_rgb)
             self.load_footer_effect.start(VerticalWipeDirection.UP)
 
         elif self.load_footer_effect.in_effect == True:
@@ -164,15 +183,13 @@ class StatueSection(Section):
             temp_console = Console(width=self.width, height=self.header_height, order="F")
             temp_console.tiles_rgb[0 :self.width, 0: self.header_height] = self.tiles[0 :self.width, 0: self.header_height]["graphic"]
 
-            self.load_header_effect.tiles = temp_console.tiles
+            self.load_header_effect.set_tiles(temp_console.tiles_rgb)
             self.load_header_effect.start(VerticalMoveDirection.DOWN)
 
         elif self.load_header_effect.in_effect == True:
             self.load_header_effect.render(console)
 
-        temp_console = Console(width=self.width, height=self.footer_height, order="F")
-        temp_console.tiles_rgb[0 :self.width, 0: self.footer_height] = self.tiles[0 :self.width, self.footer_y: self.footer_y + self.footer_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=0, dest_y=self.footer_y, width=self.width, height=self.footer_height)
+        self.render_tiles(console, 0, self.footer_y, self.width, self.footer_height)
 
     def render_load_sides(self, console):
         if self.load_side_left_effect == None:
@@ -188,26 +205,22 @@ class StatueSection(Section):
             left_temp_console = Console(width=self.sides_width, height=self.sides_height, order="F")
             left_temp_console.tiles_rgb[0 :self.sides_width, 0: self.sides_height] = self.tiles[0 :self.sides_width, self.sides_y: self.sides_y+ self.sides_height]["graphic"]
 
-            self.load_side_left_effect.tiles = left_temp_console.tiles
+            self.load_side_left_effect.set_tiles(left_temp_console.tiles_rgb)
             self.load_side_left_effect.start(HorizontalMoveDirection.LEFT)
 
             right_temp_console = Console(width=self.sides_width, height=self.sides_height, order="F")
             right_temp_console.tiles_rgb[0 :self.sides_width, 0: self.sides_height] = self.tiles[self.width - self.sides_width  -1 : (self.width - self.sides_width) + self.sides_width - 1, self.sides_y: self.sides_y+ self.sides_height]["graphic"]
 
-            self.load_side_right_effect.tiles = right_temp_console.tiles
+            self.load_side_right_effect.set_tiles(right_temp_console.tiles_rgb)
             self.load_side_right_effect.start(HorizontalMoveDirection.RIGHT)
 
         elif self.load_side_left_effect.in_effect == True:
             self.load_side_left_effect.render(console)
             self.load_side_right_effect.render(console)
 
-        temp_console = Console(width=self.width, height=self.footer_height, order="F")
-        temp_console.tiles_rgb[0 :self.width, 0: self.footer_height] = self.tiles[0 :self.width, self.footer_y: self.footer_y + self.footer_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=0, dest_y=self.footer_y, width=self.width, height=self.footer_height)
+        self.render_tiles(console, 0, self.footer_y, self.width, self.footer_height)
 
-        temp_console = Console(width=self.width, height=self.header_height, order="F")
-        temp_console.tiles_rgb[0 :self.width, 0: self.header_height] = self.tiles[0 :self.width, 0: self.header_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=0, dest_y=0, width=self.width, height=self.header_height)
+        self.render_tiles(console, 0, 0, self.width, self.header_height)
 
     def render_load_material(self, console):
         if self.load_material_effect == None:
@@ -222,10 +235,11 @@ class StatueSection(Section):
 
             temp_console = Console(width=self.level["width"], height=self.level["height"], order="F")
             temp_console.tiles_rgb[self.x : self.x + self.width, self.y: self.y + self.height] = self.tiles[self.level["x"]:self.level["x"]+self.level["width"], self.level["y"]:self.level["y"]+self.level["height"] ]["graphic"]
+            self.materials.render(temp_console, self.level["x"], self.level["y"], self.level["width"], self.level["height"], 0, 0)
             for entity in self.entities:
                 temp_console.print(entity.x - self.level["x"], entity.y - self.level["y"],entity.char, fg=entity.fg_color, bg=entity.bg_color)
 
-            self.load_material_effect.tiles = temp_console.tiles            
+            self.load_material_effect.set_tiles(temp_console.tiles_rgb)
             self.load_material_effect.start(BrickWallDirection.UP)
 
         elif self.load_material_effect.in_effect == True:
@@ -237,6 +251,7 @@ class StatueSection(Section):
         if self.current_text_fading_time > self.stage["start_length"]:
             if not self.finished_setup:
                 super().render(console)
+                self.materials.render(console, 0, 0, self.width, self.height, self.x, self.y)
                 if not self.level["disable_faults"]:
                     self.render_faults(console)
 
@@ -259,56 +274,19 @@ class StatueSection(Section):
         if "tutorial_text_x" in self.level:
             x_extent = self.level["tutorial_text_x"] + self.level["tutorial_text_width"]
             y_extent = self.level["tutorial_text_y"] + self.level["tutorial_text_height"]
-            for w in range(self.level["tutorial_text_x"], x_extent):
-                for h in range(self.level["tutorial_text_y"], y_extent):
-                    new_tile =  copy.copy(self.tiles[w,h]["graphic"])
-                    new_tile[1] = blend_colour(new_tile[1], (0,0,0), t)
-                    new_tile[2] = blend_colour(new_tile[2], (0,0,0), t)
-
-                    console.tiles_rgb[w,h] = new_tile
+            text_x, text_y = self.level["tutorial_text_x"], self.level["tutorial_text_y"]
+            console.tiles_rgb[text_x:x_extent, text_y:y_extent] = blend_tiles(self.tiles[text_x:x_extent, text_y:y_extent]["graphic"], black, t)
         
-        font = self.engine.font_manager.get_font("number_font")
-
         #Fade faults
         if not self.level["disable_faults"]:
-            faults_string = "0"
-            faults_console = Console(width = font.char_width * len(faults_string) + 1, height = font.char_height, order="F")
-            faults_console.tiles_rgb[0:font.char_width, 0:font.char_height] = font.get_character(faults_string[0])
-            final_width = font.char_width * len(faults_string)
-
-            final_x = self.level["faults_x"] + 2
-            if len(faults_string) > 1:
-                final_width += 1
-                final_x -= 2
-            
-            for w in range(0, final_width):
-                for h in range(0, font.char_height):
-                    new_tile =  copy.copy(faults_console.tiles[w,h])
-                    new_tile[1] = blend_colour_with_alpha(new_tile[1], (0,0,0,255), t)
-                    new_tile[2] = blend_colour_with_alpha(new_tile[2], (0,0,0,255), t)
-
-                    faults_console.tiles_rgb[w,h] = new_tile
-            faults_console.blit(console, src_x=0, src_y=0, dest_x = final_x, dest_y = self.level["faults_y"], width = final_width, height = font.char_height)
+            faults_tiles = blend_tiles(self.engine.font_manager.get_text("number_font", "0", spacing=1), black, t)
+            blit_tiles(console, faults_tiles, 0, 0, self.level["faults_x"] + 2, self.level["faults_y"])
 
         #Fade Spotting numbers
         num_to_render = '0'
         if self.spotting:
             num_to_render = str(self.spotted_statue_tiles)
-        for i in range(0, len(self.level["spotted_tiles_x"])):
-            spotting_console = Console(width = font.char_width, height = font.char_height, order="F")
-            spotting_console.tiles_rgb[0: font.char_width, 0:font.char_height] = font.get_character(num_to_render)
-
-            x = self.level["spotted_tiles_x"][i] - int(font.char_width / 2)
-            y = self.level["spotted_tiles_y"][i] - int(font.char_height / 2)
-
-            for w in range(0, font.char_width):
-                for h in range(0, font.char_height):
-                    new_tile =  copy.copy(spotting_console.tiles[w,h])
-                    new_tile[1] = blend_colour_with_alpha(new_tile[1], (0,0,0,255), t)
-                    new_tile[2] = blend_colour_with_alpha(new_tile[2], (0,0,0,255), t)
-                    spotting_console.tiles_rgb[w,h] = new_tile
-
-            spotting_console.blit(console, src_x=0, src_y=0, dest_x = x, dest_y = y, width = font.char_width, height = font.char_height)
+        self.render_spotted_numbers(console, blend_tiles(self.engine.font_manager.get_text("number_font", num_to_render), black, t))
        
         self.render_material(console)
         if self.spotting:
@@ -321,56 +299,63 @@ class StatueSection(Section):
         if render_material:
             self.render_material(console)
 
-        #Render footer
-        temp_console = Console(width=self.width, height=self.footer_height, order="F")
-        temp_console.tiles_rgb[0 :self.width, 0: self.footer_height] = self.tiles[0 :self.width, self.footer_y: self.footer_y + self.footer_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=0, dest_y=self.footer_y, width=self.width, height=self.footer_height)
+        #Render footer, header and sides, which don't change once the level is loaded so are composed once and copied over together
+        if self.static_layer is None:
+            self.compose_static_layer()
 
-        #Render header
-        temp_console = Console(width=self.width, height=self.header_height, order="F")
-        temp_console.tiles_rgb[0 :self.width, 0: self.header_height] = self.tiles[0 :self.width, 0: self.header_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=0, dest_y=0, width=self.width, height=self.header_height)
+        width = min(self.width, console.width)
+        height = min(self.height, console.height)
+        np.copyto(console.tiles_rgb[0:width, 0:height], self.static_layer.tiles_rgb[0:width, 0:height], where=self.static_mask[0:width, 0:height])
 
-        #Render side left
-        temp_console = Console(width=self.sides_width, height=self.sides_height, order="F")
-        temp_console.tiles_rgb[0 :self.sides_width, 0: self.sides_height] = self.tiles[0 :self.sides_width, self.sides_y: self.sides_y+ self.sides_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=0, dest_y=self.sides_y, width=self.sides_width, height=self.sides_height)
+    def compose_static_layer(self):
+        self.static_layer = Console(width=self.width, height=self.height, order="F")
+        self.static_layer.tiles_rgb[:] = self.tiles["graphic"]
 
-        #Render side right
-        temp_console = Console(width=self.sides_width + 1, height=self.sides_height, order="F")
-        temp_console.tiles_rgb[0 :self.sides_width + 1, 0: self.sides_height] = self.tiles[self.width - self.sides_width -1: (self.width - self.sides_width - 1) + self.sides_width + 1, self.sides_y: self.sides_y+ self.sides_height]["graphic"]
-        temp_console.blit(console, src_x=0, src_y=0, dest_x=self.width - self.sides_width - 1, dest_y=self.sides_y, width=self.sides_width + 1, height=self.sides_height)
+        self.static_mask = np.zeros((self.width, self.height), dtype=bool, order="F")
+        self.static_mask[0:self.width, self.footer_y:self.footer_y + self.footer_height] = True
+        self.static_mask[0:self.width, 0:self.header_height] = True
+        self.static_mask[0:self.sides_width, self.sides_y:self.sides_y + self.sides_height] = True
+        self.static_mask[self.width - self.sides_width - 1:self.width, self.sides_y:self.sides_y + self.sides_height] = True
+
+    def render_tiles(self, console, x, y, width, height):
+        """ Copies the section's tiles inside the x, y, width, height region onto the same place on console """
+        width = min(width, self.width - x, console.width - x)
+        height = min(height, self.height - y, console.height - y)
+        if width > 0 and height > 0:
+            console.tiles_rgb[x:x + width, y:y + height] = self.tiles["graphic"][x:x + width, y:y + height]
 
     def render_material(self, console):
-        temp_console = Console(width=self.level["width"], height=self.level["height"], order="F")
-        temp_console.tiles_rgb[self.x : self.x + self.width, self.y: self.y + self.height] = self.tiles[self.level["x"]:self.level["x"]+self.level["width"], self.level["y"]:self.level["y"]+self.level["height"] ]["graphic"]
+        level_x, level_y, level_width, level_height = self.level["x"], self.level["y"], self.level["width"], self.level["height"]
+
+        self.render_tiles(console, level_x, level_y, level_width, level_height)
+        self.materials.render(console, level_x, level_y, level_width, level_height, level_x, level_y)
         for entity in self.entities:
-            temp_console.print(entity.x - self.level["x"], entity.y - self.level["y"],entity.char, fg=entity.fg_color, bg=entity.bg_color)
-        temp_console.blit(console, dest_x=self.level["x"], dest_y=self.level["y"], width=self.level["width"], height=self.level["height"])
+            if level_x <= entity.x < level_x + level_width and level_y <= entity.y < level_y + level_height:
+                console.print(entity.x, entity.y, entity.char, fg=entity.fg_color, bg=entity.bg_color)
 
     def render_in_progress(self, console):
         super().render(console)
+        self.materials.render(console, 0, 0, self.width, self.height, self.x, self.y)
 
-        temp_console = Console(width=console.width, height=console.height, order="F")
-
-        temp_console.print(1,1, "Spotted Blocks: " + str(self.spotted_statue_tiles), (255,255,255))
-        #temp_console.blit(console, src_x=1, src_y=1, dest_x=1, dest_y=1, width=17, height=1)           
+        with console_pool.scratch(console.width, console.height) as temp_console:
+            temp_console.print(1,1, "Spotted Blocks: " + str(self.spotted_statue_tiles), (255,255,255))
+            #temp_console.blit(console, src_x=1, src_y=1, dest_x=1, dest_y=1, width=17, height=1)           
 
-        temp_console.print(1,2, "Remaining Blocks: " + str(self.remaining_blocks), (255,255,255))
-        #temp_console.blit(console, src_x=1, src_y=2, dest_x=1, dest_y=2, width=22, height=1)
+            temp_console.print(1,2, "Remaining Blocks: " + str(self.remaining_blocks), (255,255,255))
+            #temp_console.blit(console, src_x=1, src_y=2, dest_x=1, dest_y=2, width=22, height=1)
 
-        temp_console.print(1,3, "Mistakes: " + str(self.faults), (255,255,255))
-        #temp_console.blit(console, src_x=1, src_y=3, dest_x=1, dest_y=2, width=12, height=1)
+            temp_console.print(1,3, "Mistakes: " + str(self.faults), (255,255,255))
+            #temp_console.blit(console, src_x=1, src_y=3, dest_x=1, dest_y=2, width=12, height=1)
 
-        if self.level is not None:
-            if "disable_title" in self.level and not self.level["disable_title"]:
-                for i in range(0,len(self.level["name"])):
-                    if self.cleared_blocks >= self.name_char_probabilites[i]:
-                        temp_console.print(i,0, self.level["name"][i], (255,255,255))
-                        temp_console.blit(console, src_x=0, src_y=0, dest_x=self.level["name_x"], dest_y=self.level["name_y"], width=len(self.level["name"]), height=1)
+            if self.level is not None:
+                if "disable_title" in self.level and not self.level["disable_title"]:
+                    for i in range(0,len(self.level["name"])):
+                        if self.cleared_blocks >= self.name_char_probabilites[i]:
+                            temp_console.print(i,0, self.level["name"][i], (255,255,255))
+                            temp_console.blit(console, src_x=0, src_y=0, dest_x=self.level["name_x"], dest_y=self.level["name_y"], width=len(self.level["name"]), height=1)
 
-            if not self.level["disable_faults"]:
-                self.render_faults(console)
+                if not self.level["disable_faults"]:
+                    self.render_faults(console)
 
         if self.spotting:
             self.render_spotting_line(console)
@@ -378,19 +363,10 @@ class StatueSection(Section):
         self.render_spotted_tiles(console)
 
     def render_ending(self, console):
-        temp_console = Console(width=self.level["width"], height=self.level["height"], order="F")
-        temp_console.tiles_rgb[self.x : self.x + self.width, self.y: self.y + self.height] = self.tiles[self.level["x"]:self.level["x"]+self.level["width"], self.level["y"]:self.level["y"]+self.level["height"] ]["graphic"]
-        temp_console.blit(console, src_x= 0, src_y=0, dest_x = self.level["x"], dest_y=self.level["y"], width=self.level["width"], height=self.level["height"])
+        self.render_tiles(console, self.level["x"], self.level["y"], self.level["width"], self.level["height"])
  
     def render_ended(self, console):
         self.render_statue(console)
- 
-        button_width = self.ui.summary_button.width
-        button_height = self.ui.summary_button.height
-        button_console = Console(width=button_width, height=button_height, order="F")
-        button_console.draw_frame(0,0, button_width, button_height, decoration="╔═╗║ ║╚═╝")
-        button_console.print_rect(1,1,button_width, button_height,"Continue")
-        self.ui.summary_button.tiles = button_console.tiles_rgb
 
         console.print_box(0,26, self.width, 1, self.level["name"], fg=(255,255,255), bg=(0,0,0), alignment=tcod.CENTER)
 
@@ -407,109 +383,60 @@ class StatueSection(Section):
         self.ui.render(console)
    
     def render_spotting_line(self, console):
-        temp_console = Console(width=console.width, height=console.height, order="F")
-        
-        max_tile = min(10, len(self.spotted_tiles))
-        for i in range(0,max_tile):
-            tile = self.spotted_tiles[i]
-            temp_console.tiles_rgb[tile[0], tile[1]] = (9632, black,spot_line)
-            temp_console.blit(console, src_x=tile[0], src_y=tile[1], dest_x=tile[0], dest_y=tile[1], width=1, height=1)
+        with console_pool.scratch(console.width, console.height) as temp_console:
+            max_tile = min(10, len(self.spotted_tiles))
+            for i in range(0,max_tile):
+                tile = self.spotted_tiles[i]
+                temp_console.tiles_rgb[tile[0], tile[1]] = (9632, black,spot_line)
+                temp_console.blit(console, src_x=tile[0], src_y=tile[1], dest_x=tile[0], dest_y=tile[1], width=1, height=1)
 
     def render_faults(self,console):
         faults_to_render = min(99,self.faults)
         faults_string = str(faults_to_render)
-        font = self.engine.font_manager.get_font("number_font")
-        faults_console = Console(width = font.char_width * len(faults_string) + 1, height = font.char_height, order="F")
-        for i in range(0, len(faults_string)):
-            start_x = i * font.char_width
-            if i > 0:
-                start_x += 1
-            faults_console.tiles_rgb[start_x:start_x+ font.char_width, 0:font.char_height] = font.get_character(faults_string[i])
-        final_width = font.char_width * len(faults_string)
+        faults_tiles = self.engine.font_manager.get_text("number_font", faults_string, spacing=1)
 
         final_x = self.level["faults_x"] + 2
         if len(faults_string) > 1:
-            final_width += 1
             final_x -= 2
-        faults_console.blit(console, src_x=0, src_y=0, dest_x = final_x, dest_y = self.level["faults_y"], width = final_width, height = font.char_height)
+        blit_tiles(console, faults_tiles, 0, 0, final_x, self.level["faults_y"])
 
     def render_spotted_tiles(self, console):
-        font = self.engine.font_manager.get_font("number_font")
-
         num_to_render = '0'
         if self.spotting:
             num_to_render = str(self.spotted_statue_tiles)
 
-        for i in range(0, len(self.level["spotted_tiles_x"])):
-            temp_console = Console(width = font.char_width, height = font.char_height, order="F")
-            temp_console.tiles_rgb[0: font.char_width, 0:font.char_height] = font.get_character(num_to_render)
+        self.render_spotted_numbers(console, self.engine.font_manager.get_text("number_font", num_to_render))
 
-            x =self.level["spotted_tiles_x"][i] - int(font.char_width / 2)
-            y =self.level["spotted_tiles_y"][i] - int(font.char_height / 2)
-            temp_console.blit(console, src_x=0, src_y=0, dest_x = x, dest_y = y, width = font.char_width, height = font.char_height)
+    def render_spotted_numbers(self, console, number_tiles):
+        """ Draws the rasterized number centred on each of the level's spotted tiles counters """
+        for i in range(0, len(self.level["spotted_tiles_x"])):
+            x = self.level["spotted_tiles_x"][i] - int(number_tiles.shape[0] / 2)
+            y = self.level["spotted_tiles_y"][i] - int(number_tiles.shape[1] / 2)
+            blit_tiles(console, number_tiles, 0, 0, x, y)
 
     def render_statue(self, console):
-        temp_console = Console(width=self.level["width"], height=self.level["height"], order="F")
-        temp_console.tiles_rgb[self.x : self.x + self.width, self.y: self.y + self.height] = self.tiles[self.level["x"]:self.level["x"]+self.level["width"], self.level["y"]:self.level["y"]+self.level["height"] ]["graphic"]
-        temp_console.blit(console, src_x= 0, src_y=0, dest_x = self.level["x"], dest_y=self.level["y"], width=self.level["width"], height=self.level["height"])
+        self.render_tiles(console, self.level["x"], self.level["y"], self.level["width"], self.level["height"])
 
     def update_spotting_line(self):
-    
         mouse_pos = (self.engine.mouse_location[0], self.engine.mouse_location[1])
 
-        spotted_material_tiles = 0
-        self.spotted_statue_tiles = 0
-        self.spotted_tiles.clear()
-        
         if self.mousedown_point is not None and mouse_pos != self.mousedown_point:
-
-            final_line_point = (0,0)
-            if self.spotting_line_type == SpottingLineType.FREE:
-               final_line_point = mouse_pos
-            elif self.spotting_line_type == SpottingLineType.EIGHT_POINTS:
-                final_line_point = mouse_pos
-                nearest_distance = self.get_distance_between_tiles(mouse_pos, self.mousedown_point)
-                for tile in self.get_moore_surrounding_tiles(self.mousedown_point[0], self.mousedown_point[1]):
-                    distance = self.get_distance_between_tiles(mouse_pos, tile)
-                    if distance < nearest_distance:
-                        nearest_distance = distance
-                        final_line_point = tile
-                        
-            #Figure out the normalised vector between the mouse and the button press point            
-            spot_line_magnitude = sqrt((abs(final_line_point[0]-self.mousedown_point[0])**2) + (abs(final_line_point[1]-self.mousedown_point[1])**2))
-            spot_line_normalised = ((final_line_point[0]-self.mousedown_point[0])/spot_line_magnitude,  (final_line_point[1]-self.mousedown_point[1])/spot_line_magnitude)
-
-            #Extend the line along the vector between the mouse and the button press point           
-            final_spot = (self.mousedown_point[0] + int(spot_line_normalised[0] * 10),self.mousedown_point[1] + int(spot_line_normalised[1] * 10))
-
-
-            #Loop through all of the points in this line
-            for tile in self.line_between(self.mousedown_point, final_spot):
-                if self.is_point_in_section(tile[0], tile[1]):
-                    entities = self.get_entities_at_location(tile[0], tile[1])
-                    if len(entities) >= 1: #If there are entites at this tile...
-                        for entity in entities:
-                            if isinstance(entity, Material):
-                                spotted_material_tiles += 1 #Track how much material we have seen, blocker or statue
-                            
-                                if spotted_material_tiles > self.max_spotted_material_tiles: #If we've seen as deep as the rules allow, return
-                                    return
-
-                                if isinstance(entity, StatueMaterial): #If its staute material, track it so we can display it on the UI
-                                    self.spotted_statue_tiles += 1
-
-                    elif spotted_material_tiles > 0: #If there are no entities, but we have seen material in the past, return
-                        return
-                        
-                    self.spotted_tiles.append(tile)
+            snap = self.spotting_line_type == SpottingLineType.EIGHT_POINTS
+            self.spotted_tiles, self.spotted_statue_tiles = self.spotting_ray.spot(self.mousedown_point, mouse_pos, snap, self.board_version, self.max_spotted_material_tiles)
         else:
-            self.spotted_tiles.append([mouse_pos[0], mouse_pos[1]])
+            self.spotted_statue_tiles = 0
+            self.spotted_tiles = [[mouse_pos[0], mouse_pos[1]]]
 
     def mousedown(self,button,x,y):
         if not self.engine.is_confirmation_dialog_open() and (self.state == StatueState.LOAD_TEXT or self.state == StatueState.IN_PROGRESS):
             processed_entity = False
             if not self.spotting:
-                for entity in self.get_entities_at_location(self.engine.mouse_location[0], self.engine.mouse_location[1]):
+                mouse_x, mouse_y = self.engine.mouse_location
+                if self.materials.is_material(mouse_x, mouse_y):
+                    self.materials.mousedown(mouse_x, mouse_y, button)
+                    processed_entity = True
+
+                for entity in self.get_entities_at_location(mouse_x, mouse_y):
                     entity.mousedown(button)
                     processed_entity = True
 
@@ -525,22 +452,15 @@ class StatueSection(Section):
         if key == tcod.event.K_RETURN and self.state == StatueState.ENDED:
             LevelCompleteAction(self.engine, StatueSummary(self.level, self.faults)).perform()
 
-    def line_between(self, start, end):
-        """Return an line between these two points."""
-        x1, y1 = start
-        x2, y2 = end
-
-        # Generate the coordinates for this tunnel.
-        for x, y in tcod.los.bresenham((x1, y1), (x2, y2)).tolist():
-            yield x, y
-
-    def update_graph(self):
+    def update_cost(self):
+        """ Rebuilds the whole cost grid, where material and entities that block movement can't be crossed """
         self.cost = np.array(self.tiles["walkable"], dtype=np.int8)
+        self.cost[self.materials.alive] = 0
         for entity in self.entities:
             if entity.blocks_movement:
                 self.cost[entity.x, entity.y] = 0
 
-        self.graph = tcod.path.SimpleGraph(cost=self.cost, cardinal=1, diagonal=1)
+        self.board_loaded = True
 
     def chisel_fault(self):
         self.fault_sound.play()
@@ -552,7 +472,7 @@ class StatueSection(Section):
         if new_state == StatueState.ENDED:
             self.transistioning_to_state = StatueState.ENDED
             print("Changing to ENDED")
-            Timer(1.0, self.end_level).start()   
+            self.engine.scheduler.call_later(1.0, self.end_level)
         elif new_state == StatueState.IN_PROGRESS:
             self.state = StatueState.IN_PROGRESS
             QueueMusicAction(self.engine, self.stage["name"] ).perform()
@@ -567,41 +487,89 @@ class StatueSection(Section):
         if self.complete_sound is not None:
             self.complete_sound.play()
         self.state = StatueState.ENDING 
-        Timer(self.stage["end_length"],self.change_state,[StatueState.ENDED]).start()
+        self.engine.scheduler.call_later(self.stage["end_length"], self.change_state, StatueState.ENDED)
 
     def end_level(self):
         self.ui = self.statue_ended_ui
         self.ui.summary_button.set_action(LevelCompleteAction(self.engine, StatueSummary(self.level, self.faults)))
+        self.build_summary_button_tiles()
         self.state = StatueState.ENDED
         self.transistioning_to_state = StatueState.NONE
              
 
+    def build_summary_button_tiles(self):
+        """ The Continue button never changes, so its tiles are drawn once as the level ends rather than every frame """
+        button = self.ui.summary_button
+        with console_pool.scratch(button.width, button.height) as button_console:
+            button_console.draw_frame(0,0, button.width, button.height, decoration="╔═╗║ ║╚═╝")
+            button_console.print_rect(1,1,button.width, button.height,"Continue")
+            button.tiles = button_console.tiles_rgb.copy()
+
     def add_entity(self, entity):
-        if isinstance(entity, BlockMaterial):
-            self.remaining_blocks += 1
-        elif isinstance(entity, Anchor):
+        if isinstance(entity, Anchor):
             self.anchor = entity
-        elif isinstance(entity, StatueMaterial):
-            self.remaining_statue += 1
-        self.entities.append(entity)
-        self.update_graph()
+        super().add_entity(entity)
+        self.board_changed()
     
     def remove_entity(self, entity):
-        if isinstance(entity, BlockMaterial):
+        super().remove_entity(entity)
+        self.board_changed()
+
+    def entity_moved(self, entity):
+        # Any entity changes which tiles a spotting line sees as occupied, but only blocking ones and the anchor change the cost
+        # grid or what's connected to the anchor
+        if entity.blocks_movement or entity is self.anchor:
+            self.board_changed()
+        else:
+            self.board_version += 1
+
+    def add_material(self, material_type, x, y):
+        self.add_materials(material_type, [x], [y])
+
+    def add_materials(self, material_type, xs, ys):
+        if material_type == MaterialType.BLOCK:
+            self.remaining_blocks += len(xs)
+        elif material_type == MaterialType.STATUE:
+            self.remaining_statue += len(xs)
+        self.materials.add_materials(material_type, xs, ys)
+        self.board_changed()
+
+    def board_changed(self):
+        """ Rebuilds the cost grid after entities or material were added or removed, unless a bulk load is batching them """
+        self.board_version += 1
+        if not self.bulk_loading:
+            self.update_cost()
+            self.connectivity.mark_dirty()
+
+    def commit_bulk_load(self):
+        super().commit_bulk_load()
+        self.board_changed()
+
+    def remove_material(self, x, y):
+        material_type = self.materials.get_type(x, y)
+        if material_type == MaterialType.NONE:
+            return
+
+        if material_type == MaterialType.BLOCK:
             self.remaining_blocks -= 1
             self.cleared_blocks += 1
             self.left_click_sound.play()
-        if isinstance(entity, StatueMaterial):
+        elif material_type == MaterialType.STATUE:
             self.remaining_statue -= 1
             self.cleared_blocks += 1
             self.right_click_sound.play()
 
         if self.total_remaining_blocks() == 0:
             EndMusicQueueAction(self.engine, 500).perform()
-            Timer(2.0,self.complete_level).start()
+            self.engine.scheduler.call_later(2.0, self.complete_level)
 
-        super().remove_entity(entity)
-        self.update_graph()
+        self.materials.remove_material(x, y)
+        self.board_version += 1
+
+        # Only this cell's cost can have changed, so there's no need to rebuild the whole grid
+        blocked = any(entity.blocks_movement for entity in self.get_entities_at_location(x, y))
+        self.cost[x, y] = 0 if blocked else self.tiles["walkable"][x, y]
+        self.connectivity.open_cell(x, y)
 
     def total_remaining_blocks(self):
         return self.remaining_statue + self.remaining_blocks
@@ -610,17 +578,23 @@ class StatueSection(Section):
         self.reset()
 
         self.stage = stage
+
+        level_assets = self.level_prefetcher.get(stage, level)
         
-        if stage["ending_music"] != "" and stage["start_music"] != "":
-            self.complete_sound = self.validate_sound('Sounds/' + stage["ending_music"])
-            self.start_sound = self.validate_sound('Sounds/' + stage["start_music"])
+        if level_assets.start_sound is not None:
+            self.complete_sound = level_assets.complete_sound
+            self.start_sound = level_assets.start_sound
+
+            # The sounds may have been prefetched, or cached from an earlier load, before the volume was last changed
+            volume = self.engine.save_data["volume"]
+            self.complete_sound.set_volume(volume)
+            self.start_sound.set_volume(volume)
             self.start_sound.play()
         
         self.curtain_sound.play()
 
-        xp_data = self.load_xp_data(level["file"])
-        self.load_tiles(level["file"], xp_data)
-        self.load_entities(level["file"], xp_data)
+        self.load_tiles(level["file"], level_assets.xp_data)
+        self.load_entities(level["file"], level_assets.xp_data)
 
         if "fg_color" in level and "bg_color" in level:
             self.colour_material(level["fg_color"], level["bg_color"])
@@ -642,9 +616,10 @@ class StatueSection(Section):
         self.name_char_probabilites = list(map(lambda num: max(1,int(num * probability_step)), range(1, len(self.level["name"]) + 1)))
         random.shuffle(self.name_char_probabilites)
         
+    def prefetch_level(self, stage, level):
+        self.level_prefetcher.prefetch(stage, level)
+
     def colour_material(self, fg_color, bg_color):
-        for entity in self.entities:
-            if isinstance(entity, Material):
-                entity.set_initial_colors(bg_color, fg_color)
+        self.materials.set_initial_colors(bg_color, fg_color)
 
 
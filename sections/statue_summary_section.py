@@ -1,15 +1,15 @@
 
-import json
 import math
 from enum import Enum, auto
 from random import randrange
-from threading import Timer
 
+import asset_bundle
 import numpy as np
 import tcod
 from pygame import mixer
 from tcod import Console
 from ui.statue_summary_ui import StatueSummaryUI
+from utils.console_pool import console_pool
 
 from sections.section import Section
 
@@ -25,8 +25,7 @@ class StatueSummarySection(Section):
         super().__init__(engine, x, y, width, height, xp_filepath)      
         self.summary = None
 
-        with open ( "game_data/summary_layout.json" ) as f:
-            self.layout = json.load(f)
+        self.layout = asset_bundle.load_json("game_data/summary_layout.json")
 
         self.crown_unlocked_console = self.fill_crown_console("crown_unlocked")
         self.crown_empty_console = self.fill_crown_console("crown_empty")
@@ -101,36 +100,34 @@ class StatueSummarySection(Section):
     def render_static_info(self, console):
         super().render(console)
 
-        temp_console = Console(width=console.width, height=console.height, order="F")
-
-        text_width = self.layout["name_available_width"]
-        text_console = Console(width=text_width, height= 1, order="F")
-
-        text_console.print_box(0,0, text_width, 1, self.summary.level["name"], (255,255,255), alignment=tcod.CENTER)  
-        text_console.blit(console, dest_x=self.layout["title_x"], dest_y=self.layout["title_y"], width=text_width, height=1)  
-        text_console.clear()     
-
-        info_text = ""
-        if self.summary.level["artist"] != "N/A":
-            info_text += self.summary.level["artist"]
-        if self.summary.level["date"] != "N/A":
-            if len(info_text) > 0:
-                info_text += " - "
-            info_text += self.summary.level["date"]
-        text_console.print_box(0,0,text_width,1,info_text, (255,255,255), alignment=tcod.CENTER)  
-        text_console.blit(console, dest_x=self.layout["info_x"], dest_y=self.layout["info_y"], width=text_width, height=1)     
-
-        temp_console.print(0,0, str(self.summary.faults), (255,255,255))
-        temp_console.blit(console, dest_x=self.layout["faults_x"], dest_y=self.layout["faults_y"], width=len(str(self.summary.faults)), height=1)        
-
-        cw = self.layout["crown_width"]
-        ch = self.layout["crown_height"]
-
-        temp_console.clear()
-        bgw = cw * self.layout["num_crown_col"]
-        bgh = ch * int(self.layout["num_crown_col"]/self.summary.level["num_crowns"])
-        temp_console.draw_rect(0,0, bgw,bgh,ch = ord(" "), fg = (0,0,0))
-        temp_console.blit(console,  dest_x=self.layout["crown_start_x"], dest_y=self.layout["crown_start_y"], width=bgw, height=bgh)
+        with console_pool.scratch(console.width, console.height) as temp_console:
+            text_width = self.layout["name_available_width"]
+            with console_pool.scratch(text_width, 1) as text_console:
+                text_console.print_box(0,0, text_width, 1, self.summary.level["name"], (255,255,255), alignment=tcod.CENTER)  
+                text_console.blit(console, dest_x=self.layout["title_x"], dest_y=self.layout["title_y"], width=text_width, height=1)  
+                text_console.clear()     
+
+                info_text = ""
+                if self.summary.level["artist"] != "N/A":
+                    info_text += self.summary.level["artist"]
+                if self.summary.level["date"] != "N/A":
+                    if len(info_text) > 0:
+                        info_text += " - "
+                    info_text += self.summary.level["date"]
+                text_console.print_box(0,0,text_width,1,info_text, (255,255,255), alignment=tcod.CENTER)  
+                text_console.blit(console, dest_x=self.layout["info_x"], dest_y=self.layout["info_y"], width=text_width, height=1)     
+
+            temp_console.print(0,0, str(self.summary.faults), (255,255,255))
+            temp_console.blit(console, dest_x=self.layout["faults_x"], dest_y=self.layout["faults_y"], width=len(str(self.summary.faults)), height=1)        
+
+            cw = self.layout["crown_width"]
+            ch = self.layout["crown_height"]
+
+            temp_console.clear()
+            bgw = cw * self.layout["num_crown_col"]
+            bgh = ch * int(self.layout["num_crown_col"]/self.summary.level["num_crowns"])
+            temp_console.draw_rect(0,0, bgw,bgh,ch = ord(" "), fg = (0,0,0))
+            temp_console.blit(console,  dest_x=self.layout["crown_start_x"], dest_y=self.layout["crown_start_y"], width=bgw, height=bgh)
 
     def render_crowns(self, console, num_empty):
         cw = self.layout["crown_width"]
@@ -147,14 +144,13 @@ class StatueSummarySection(Section):
                 self.crown_unlocked_console.blit(console, dest_x=x, dest_y=y, width=cw, height=ch)
 
     def render_total(self, console, total, new):
-        temp_console = Console(width=5, height=1, order="F")
-
-        temp_console.print(0,0, str(total), (255,255,255))  
-        temp_console.blit(console, dest_x=self.layout["total_x"], dest_y=self.layout["total_y"], width=5, height=1)   
+        with console_pool.scratch(5, 1) as temp_console:
+            temp_console.print(0,0, str(total), (255,255,255))  
+            temp_console.blit(console, dest_x=self.layout["total_x"], dest_y=self.layout["total_y"], width=5, height=1)   
 
-        temp_console.clear()
-        temp_console.print(0,0, str(new), (255,255,255))  
-        temp_console.blit(console, dest_x=self.layout["new_x"], dest_y=self.layout["new_y"], width=5, height=1)   
+            temp_console.clear()
+            temp_console.print(0,0, str(new), (255,255,255))  
+            temp_console.blit(console, dest_x=self.layout["new_x"], dest_y=self.layout["new_y"], width=5, height=1)   
 
     def setup(self, summary):
         if self.state == SummaryState.INACTIVE:
@@ -177,7 +173,7 @@ class StatueSummarySection(Section):
 
             self.sounds_to_play = self.crowns_awarded
 
-            Timer(2.0, self.display_scores).start()
+            self.engine.scheduler.call_later(2.0, self.display_scores)
 
     def close(self):
         self.reset()
@@ -19,6 +19,9 @@ tile_dt = np.dtype(
     ]
 )
 
+# What a freshly made console is filled with, so what anything not drawn over shows as
+blank_graphic = np.array((ord(" "), (255, 255, 255), (0, 0, 0)), dtype=graphic_dt)
+
 
 def new_tile(walkable, graphic) -> np.ndarray:
     return np.array((walkable, graphic), dtype=tile_dt)
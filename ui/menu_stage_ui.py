@@ -37,4 +37,6 @@ class MenuStageUI(UI):
 
             bd[1] += 2
 
+        self.invalidate_hit_grid()
+
         
\ No newline at end of file
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from threading import Timer
 from typing import TYPE_CHECKING
 from urllib import response
 
 import keyboard
+import numpy as np
 import tcod.event
 from actions.actions import Action, CloseMenu, EscapeAction, OpenMenu
 from effects.horizontal_wipe_effect import (HorizontalWipeDirection,
                                             HorizontalWipeEffect)
 from tcod import Console, event
+from utils.console_pool import console_pool
 from utils.utils import translate_range
 
+if TYPE_CHECKING:
+    from scheduler import Scheduler
+
 
 class UI:
     def __init__(self, section, x=0, y=0):
@@ -22,6 +26,10 @@ class UI:
         self.section = section
         self.enabled = True
 
+        # Which elements cover each cell, as an index into hit_stacks, built the first time it's needed after elements change
+        self.hit_grid = None
+        self.hit_stacks = None
+
     def render(self, console: Console):
         for element in self.elements:
             element.render(console)
@@ -37,12 +45,12 @@ class UI:
         if self.enabled == False:
             return
             
+        elements_hit = self.get_elements_at(x, y)
         for element in self.elements:
-            if element.is_mouseover(x, y):
+            if element in elements_hit:
                 element.on_mousedown(x,y)
             elif isinstance(element, Input):
-                element.selected = False
-                element.blink = False
+                element.deselect()
 
     def mouseup(self, x: int, y: int):
         if self.enabled == False:
@@ -55,29 +63,70 @@ class UI:
         if self.enabled == False:
             return
             
+        elements_hit = self.get_elements_at(x, y)
+        hover_changed = False
         for element in self.elements:
-            if element.is_mouseover(x, y):
+            if element in elements_hit:
                 if element.mouseover == False:
                     element.on_mouseenter()
+                    hover_changed = True
                 element.mouseover = True
             else:
                 if element.mouseover == True:
                     element.on_mouseleave()
+                    hover_changed = True
                 element.mouseover = False
 
             element.mousemove(x,y)
         
-        self.sort_elements()
+        if hover_changed:
+            self.sort_elements()
 
     def add_element(self, element):
         element.x = element.x + self.x
         element.y = element.y + self.y
         self.elements.append(element)
         self.sort_elements()
+        self.invalidate_hit_grid()
+
+    def invalidate_hit_grid(self):
+        """ Needs calling whenever elements are added, removed or moved, so the next hit test sees them where they are """
+        self.hit_grid = None
+
+    def build_hit_grid(self):
+        cell_elements = dict()
+        for element in self.elements:
+            xs, ys = element.get_hit_tiles()
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                if x >= 0 and y >= 0:
+                    cell_elements.setdefault((x, y), list()).append(element)
+
+        width = max([x + 1 for x, _ in cell_elements], default=0)
+        height = max([y + 1 for _, y in cell_elements], default=0)
+        self.hit_grid = np.zeros((width, height), dtype=np.int32, order="F")
+
+        # Cells covered by the same elements share a stack, each one ordered top-most first
+        self.hit_stacks = [()]
+        stack_indices = {(): 0}
+        for (x, y), elements in cell_elements.items():
+            stack = tuple(sorted(elements, key=lambda element: element.render_order, reverse=True))
+            if stack not in stack_indices:
+                stack_indices[stack] = len(self.hit_stacks)
+                self.hit_stacks.append(stack)
+            self.hit_grid[x, y] = stack_indices[stack]
+
+    def get_elements_at(self, x: int, y: int):
+        """ Every element under the given cell, top-most first """
+        if self.hit_grid is None:
+            self.build_hit_grid()
+
+        x, y = int(x), int(y)
+        if 0 <= x < self.hit_grid.shape[0] and 0 <= y < self.hit_grid.shape[1]:
+            return self.hit_stacks[self.hit_grid[x, y]]
+        return ()
 
     def sort_elements(self):
-        self.elements.sort(key = lambda element: element.render_order)
-        self.elements.sort(key = lambda element: element.mouseover)
+        self.elements.sort(key = lambda element: (element.mouseover, element.render_order))
 
 class UIElement:
     def __init__(self, x, y, width, height):
@@ -104,6 +153,11 @@ class UIElement:
     def is_mouseover(self, x: int, y: int):
         return self.x<= x <= self.x + self.width - 1 and self.y <= y <= self.y + self.height - 1
 
+    def get_hit_tiles(self):
+        """ The x and y of every cell the element can be hovered or clicked on, matching is_mouseover """
+        xs, ys = np.mgrid[self.x:self.x + self.width, self.y:self.y + self.height]
+        return xs.ravel(), ys.ravel()
+
     def mousemove(self,x,y):
         pass
 
@@ -130,19 +184,18 @@ class Button(UIElement):
         if self.tiles is None:
             return
 
-        temp_console = Console(width=self.width, height=self.height, order="F")
-
-        for h in range(0,self.height):
-            for w in range(0, self.width):
-                if self.tiles[w,h][0] != 9488:
-                    if self.mouseover:
-                        self.tiles[w,h][1] = self.highlight_bg
-                    else:
-                        self.tiles[w,h][1] = self.normal_bg 
+        with console_pool.scratch(self.width, self.height) as temp_console:
+            for h in range(0,self.height):
+                for w in range(0, self.width):
+                    if self.tiles[w,h][0] != 9488:
+                        if self.mouseover:
+                            self.tiles[w,h][1] = self.highlight_bg
+                        else:
+                            self.tiles[w,h][1] = self.normal_bg 
                         
-                temp_console.tiles_rgb[w,h] = self.tiles[w,h]
+                    temp_console.tiles_rgb[w,h] = self.tiles[w,h]
 
-        temp_console.blit(console, self.x, self.y)
+            temp_console.blit(console, self.x, self.y)
 
     def on_mousedown(self, x: int, y: int):
         if self.click_action is not None:
@@ -164,63 +217,74 @@ class ShapedButton(Button):
         self.active_tiles = active_tiles
 
     def render(self, console: Console):
-        temp_console = Console(width=self.width, height=self.height, order="F")
-
-        for h in range(0,self.height):
-            for w in range(0, self.width):
-                temp_console.tiles_rgb[w,h] = self.tiles[w,h]
+        with console_pool.scratch(self.width, self.height) as temp_console:
+            for h in range(0,self.height):
+                for w in range(0, self.width):
+                    temp_console.tiles_rgb[w,h] = self.tiles[w,h]
 
-        if self.mouseover:
-            for tile in self.active_tiles:
-                temp_console.tiles_rgb[tile[0],tile[1]][0] = ord(' ')
-                temp_console.tiles_rgb[tile[0],tile[1]][2] = (0,255,0)
+            if self.mouseover:
+                for tile in self.active_tiles:
+                    temp_console.tiles_rgb[tile[0],tile[1]][0] = ord(' ')
+                    temp_console.tiles_rgb[tile[0],tile[1]][2] = (0,255,0)
 
-        temp_console.blit(console, self.x, self.y)
+            temp_console.blit(console, self.x, self.y)
 
     def is_mouseover(self, x,y):
         for tile in self.active_tiles:
             if tile[0] == int(x - self.x) and tile[1] == int(y - self.y):
                 return True
         return False
+
+    def get_hit_tiles(self):
+        tiles = np.array(self.active_tiles, dtype=np.int64).reshape(-1, 2)
+        return tiles[:, 0] + self.x, tiles[:, 1] + self.y
             
 class Input(UIElement):
-    def __init__(self, x: int, y: int, width: int, height: int):
+    def __init__(self, x: int, y: int, width: int, height: int, scheduler: Scheduler):
         super().__init__(x,y,width,height)
+        self.scheduler = scheduler
         self.selected = False
         self.text = ''
+        self.blink = False
         self.blink_interval = 0.7
+        self.blink_call = None
         self.bg_color = (0,0,0)
         self.fg_color = (255,255,255)
 
     def render(self, console: Console):
-        temp_console = Console(width=self.width, height=self.height)
-        for w in range(0,self.width):
-            if w < len(self.text):
-                temp_console.tiles_rgb[0,w] = (ord(self.text[w]), self.fg_color , self.bg_color)
-            else:
-                temp_console.tiles_rgb[0,w] = (ord(' '), self.fg_color , self.bg_color)
+        with console_pool.scratch(self.width, self.height, order="C") as temp_console:
+            for w in range(0,self.width):
+                if w < len(self.text):
+                    temp_console.tiles_rgb[0,w] = (ord(self.text[w]), self.fg_color , self.bg_color)
+                else:
+                    temp_console.tiles_rgb[0,w] = (ord(' '), self.fg_color , self.bg_color)
 
-        if self.selected == True:
-            if self.blink == True:
-                temp_console.tiles_rgb[0,len(self.text)] = (9488, self.fg_color , self.bg_color)
+            if self.selected == True:
+                if self.blink == True:
+                    temp_console.tiles_rgb[0,len(self.text)] = (9488, self.fg_color , self.bg_color)
 
-        temp_console.blit(console, self.x, self.y)
+            temp_console.blit(console, self.x, self.y)
 
-    def blink_on(self):
+    def select(self):
+        self.selected = True
         self.blink = True
-        if self.selected == True:
-            t = Timer(self.blink_interval, self.blink_off)
-            t.start()
-    
-    def blink_off(self):
+        # Reselecting restarts the cursor blink rather than stacking up another one
+        if self.blink_call is not None:
+            self.blink_call.cancel()
+        self.blink_call = self.scheduler.call_every(self.blink_interval, self.toggle_blink)
+
+    def deselect(self):
+        self.selected = False
         self.blink = False
-        if self.selected == True:
-            t = Timer(self.blink_interval, self.blink_on)
-            t.start()
+        if self.blink_call is not None:
+            self.blink_call.cancel()
+            self.blink_call = None
+
+    def toggle_blink(self):
+        self.blink = not self.blink
 
     def on_mousedown(self, x: int, y: int):
-        self.selected = True
-        self.blink_on()
+        self.select()
 
     def on_keydown(self, event):
         if self.selected == True:
@@ -229,8 +293,7 @@ class Input(UIElement):
             if key == tcod.event.K_BACKSPACE:
                 self.text = self.text[:-1]
             elif key == tcod.event.K_RETURN or key == tcod.event.K_ESCAPE:
-                self.selected = False
-                self.blink = False
+                self.deselect()
             elif key == tcod.event.K_SPACE and len(self.text) < self.width - 1:
                 self.text += ' '
             elif len(self.text) < self.width - 1 and tcod.event.K_a <= key <= tcod.event.K_z:
@@ -241,7 +304,7 @@ class Input(UIElement):
 
 class CheckedInput(Input):
     def __init__(self, x: int, y: int, width: int, height: int, check_string: str, trigger_once : bool, completion_action: Action, completion_color : (), completion_effect : HorizontalWipeEffect):
-        super().__init__(x,y,width,height)
+        super().__init__(x,y,width,height, completion_effect.engine.scheduler)
         self.check_string = check_string
         self.input_correct = False
         self.completion_action = completion_action
@@ -264,8 +327,7 @@ class CheckedInput(Input):
 
     def on_mousedown(self, x: int, y: int):
         if self.input_correct == False or self.input_correct == True and self.trigger_once == False :
-            self.selected = True
-            self.blink_on()
+            self.select()
 
     def on_keydown(self, event):
         if self.selected == True:
@@ -277,7 +339,7 @@ class CheckedInput(Input):
                     self.completion_action.perform()
 
                     if self.trigger_once == True:
-                        self.selected = False
+                        self.deselect()
             else:
                 self.input_correct = False
 
@@ -334,18 +396,17 @@ class Tooltip(UIElement):
             self.visible = True
 
         if self.visible == True:
-            temp_console = Console(width=self.render_width, height=self.render_height, order="F")
-
-            for h in range(0,self.render_height):
-                for w in range(0, self.render_width):
-                    temp_console.tiles_rgb[w,h][2] = (255,255,255) 
+            with console_pool.scratch(self.render_width, self.render_height) as temp_console:
+                for h in range(0,self.render_height):
+                    for w in range(0, self.render_width):
+                        temp_console.tiles_rgb[w,h][2] = (255,255,255) 
 
-            count = 1
-            for l in self.lines:
-                temp_console.print(1, count, l, (0,0,0))
-                count += 1
+                count = 1
+                for l in self.lines:
+                    temp_console.print(1, count, l, (0,0,0))
+                    count += 1
 
-            temp_console.blit(console, self.x + self.x_offset, self.y+self.y_offset)
+                temp_console.blit(console, self.x + self.x_offset, self.y+self.y_offset)
 
 class Toggle(Button):
     def __init__(self, x: int, y: int, width: int, height: int, is_on: bool, on_action: Action, off_action: Action, tiles, on_tiles, off_tiles, response_x:int, response_y:int, normal_bg = (255,255,255), highlight_bg = (128,128,128)):
@@ -363,29 +424,28 @@ class Toggle(Button):
         if self.tiles is None:
             return
 
-        temp_console = Console(width=self.width, height=self.height, order="F")
-
-        for h in range(0,self.height):
-            for w in range(0, self.width):
-                if self.tiles[w,h][0] != 9488:
-                    if self.mouseover:
-                        self.tiles[w,h][1] = self.highlight_bg
-                    else:
-                        self.tiles[w,h][1] = self.normal_bg 
+        with console_pool.scratch(self.width, self.height) as temp_console:
+            for h in range(0,self.height):
+                for w in range(0, self.width):
+                    if self.tiles[w,h][0] != 9488:
+                        if self.mouseover:
+                            self.tiles[w,h][1] = self.highlight_bg
+                        else:
+                            self.tiles[w,h][1] = self.normal_bg 
                         
-                temp_console.tiles_rgb[w,h] = self.tiles[w,h]
+                    temp_console.tiles_rgb[w,h] = self.tiles[w,h]
         
-        tiles_to_draw = self.on_tiles if self.is_on else self.off_tiles
-        shape = self.on_tiles.shape
-        for h in range(0,shape[1]):
-            for w in range(0, shape[0]):
-                temp_console.tiles_rgb[self.response_x + w, self.response_y + h] = tiles_to_draw[w,h]["graphic"]
-                if self.mouseover:
-                    temp_console.tiles_rgb[self.response_x + w, self.response_y + h][1] = self.highlight_bg
-                else:
-                    temp_console.tiles_rgb[self.response_x + w, self.response_y + h][1] = self.normal_bg 
+            tiles_to_draw = self.on_tiles if self.is_on else self.off_tiles
+            shape = self.on_tiles.shape
+            for h in range(0,shape[1]):
+                for w in range(0, shape[0]):
+                    temp_console.tiles_rgb[self.response_x + w, self.response_y + h] = tiles_to_draw[w,h]["graphic"]
+                    if self.mouseover:
+                        temp_console.tiles_rgb[self.response_x + w, self.response_y + h][1] = self.highlight_bg
+                    else:
+                        temp_console.tiles_rgb[self.response_x + w, self.response_y + h][1] = self.normal_bg 
 
-        temp_console.blit(console, self.x, self.y)
+            temp_console.blit(console, self.x, self.y)
 
     def on_mousedown(self, x: int, y: int):
         if self.is_on:
@@ -0,0 +1,41 @@
+import threading
+from contextlib import contextmanager
+
+from tcod import Console
+
+
+class ConsolePool:
+    """
+    Hands out cleared scratch consoles for render code that needs somewhere to draw before blitting, keeping them once they're
+    given back so steady state frames reuse the same few consoles rather than allocating new ones every call.
+    """
+    def __init__(self):
+        self.free_consoles = dict()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def scratch(self, width: int, height: int, order: str = "F"):
+        console = self.acquire(width, height, order)
+        try:
+            yield console
+        finally:
+            self.release(console, order)
+
+    def acquire(self, width: int, height: int, order: str = "F"):
+        with self.lock:
+            consoles = self.free_consoles.get((width, height, order))
+            console = consoles.pop() if consoles else None
+
+        if console is None:
+            return Console(width=width, height=height, order=order)
+
+        # Match a freshly made console, whatever defaults the last user set
+        console.clear(ch=ord(" "), fg=(255, 255, 255), bg=(0, 0, 0))
+        return console
+
+    def release(self, console: Console, order: str = "F"):
+        with self.lock:
+            self.free_consoles.setdefault((console.width, console.height, order), list()).append(console)
+
+
+console_pool = ConsolePool()
@@ -1,15 +1,98 @@
 import time
+from collections import deque
+
+import numpy as np
 
 
 class DeltaTime:
-    def __init__(self):
-        self.delta_time = 0.16
-        self.last_tick = time.time()
+    """
+    The game clock. Measures time with the monotonic perf_counter_ns, so wall clock jumps can't upset it. update_delta_time
+    works out the dt handed to the game, which can be paused and scaled, and record_frame keeps a rolling window of how long
+    each rendered frame really took for frame pacing stats.
+    """
+    def __init__(self, window: int = 120, smoothing: float = 0.1):
+        self.delta_time = 0.0
+        self.smoothed_delta_time = 0.0
+        self.smoothing = smoothing
+        self.last_tick = time.perf_counter_ns()
+        self.last_frame = None
+        self.updated = False
+
+        # Real time each rendered frame took, in seconds, unaffected by pausing or scaling
+        self.frame_times = deque(maxlen=window)
 
+        self.paused = False
+        self.time_scale = 1.0
 
     def get_delta_time(self):
         return self.delta_time
 
+    def get_smoothed_delta_time(self):
+        """ An exponential moving average of dt, for anything that would rather not jitter with every frame """
+        return self.smoothed_delta_time
+
     def update_delta_time(self):
-        self.delta_time = abs(self.last_tick - time.time())
-        self.last_tick = time.time()
+        now = time.perf_counter_ns()
+        elapsed = (now - self.last_tick) / 1e9
+        self.last_tick = now
+
+        self.delta_time = 0.0 if self.paused else self.get_step(elapsed) * self.time_scale
+        if not self.updated:
+            self.smoothed_delta_time = self.delta_time
+            self.updated = True
+        else:
+            self.smoothed_delta_time += (self.delta_time - self.smoothed_delta_time) * self.smoothing
+
+    def get_step(self, elapsed):
+        """ How much game time passes for an update that came elapsed seconds after the last one """
+        return elapsed
+
+    def record_frame(self):
+        """ Call once per rendered frame, whether or not the game updated in it """
+        now = time.perf_counter_ns()
+        if self.last_frame is not None:
+            self.frame_times.append((now - self.last_frame) / 1e9)
+        self.last_frame = now
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def set_time_scale(self, time_scale: float):
+        self.time_scale = time_scale
+
+    def get_frame_time_percentile(self, percentile: float):
+        """ The given percentile of the recent frame times, in seconds """
+        if len(self.frame_times) == 0:
+            return 0.0
+        return float(np.percentile(self.frame_times, percentile))
+
+    def get_frame_stats(self):
+        """ Mean, p50, p95, p99 and max of the recent frame times, in milliseconds """
+        if len(self.frame_times) == 0:
+            return None
+
+        frame_times = np.array(self.frame_times) * 1000
+        p50, p95, p99 = np.percentile(frame_times, (50, 95, 99))
+        return {
+            "frames": len(frame_times),
+            "mean_ms": float(np.mean(frame_times)),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(np.max(frame_times)),
+        }
+
+
+class FixedDeltaTime(DeltaTime):
+    """ A synthetic clock that advances by the same step every update no matter how long it really took, still paused and scaled """
+    def __init__(self, step: float, window: int = 120):
+        super().__init__(window)
+        self.step = step
+        self.delta_time = step
+        self.smoothed_delta_time = step
+
+    def get_step(self, elapsed):
+        return self.step
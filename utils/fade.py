@@ -0,0 +1,24 @@
+import numpy as np
+
+
+def blend_tiles(tiles, target, t, out=None):
+    """
+    Blends the fg and bg of a whole array of tiles toward target, giving the same colours blend_colour(colour, target, t) would
+    for every cell. t can be a single value or an array of per cell values the same shape as tiles.
+    Works on anything with fg and bg fields (graphic_dt, tiles_rgb or tiles); only the rgb channels are blended.
+    """
+    if out is None:
+        out = tiles.copy()
+    elif out is not tiles:
+        out[...] = tiles
+
+    t = np.asarray(t, dtype=np.float64)
+    if t.ndim > 0:
+        t = t[..., np.newaxis]
+    target = np.asarray(target[0:3])
+
+    for field in ("fg", "bg"):
+        # Assigning back into the uint8 channels truncates just like int() does in blend_colour
+        out[field][..., 0:3] = tiles[field][..., 0:3] * t + target * (1 - t)
+
+    return out
@@ -0,0 +1,81 @@
+import numpy as np
+
+
+class SpatialIndex:
+    """
+    Keeps track of which entities occupy each cell of a section, so finding what's at a location doesn't mean scanning every entity.
+    Entities that wander outside the grid are still tracked, just in a dictionary rather than the grid itself.
+    """
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.cells = [[list() for y in range(height)] for x in range(width)]
+        self.outside_cells = dict()
+
+        # How many entities are in each cell, for vectorised occupancy checks over many cells at once
+        self.counts = np.zeros((width, height), dtype=np.int32, order="F")
+
+    def clear(self):
+        for entity in self.get_all():
+            entity.spatial_index = None
+
+        for column in self.cells:
+            for cell in column:
+                cell.clear()
+        self.outside_cells.clear()
+        self.counts[:] = 0
+
+    def add(self, entity):
+        self.get_cell(entity.x, entity.y, create=True).append(entity)
+        if self.is_in_grid(entity.x, entity.y):
+            self.counts[entity.x, entity.y] += 1
+        entity.spatial_index = self
+
+    def remove(self, entity):
+        self.remove_from(entity, entity.x, entity.y)
+        entity.spatial_index = None
+
+    def move(self, entity, old_x: int, old_y: int):
+        self.remove_from(entity, old_x, old_y)
+        self.get_cell(entity.x, entity.y, create=True).append(entity)
+        if self.is_in_grid(entity.x, entity.y):
+            self.counts[entity.x, entity.y] += 1
+
+    def get(self, x: int, y: int):
+        cell = self.get_cell(x, y)
+        return list(cell) if cell else list()
+
+    def get_many(self, locations):
+        """ Returns a list of the entities at each of the given (x, y) locations, in the same order """
+        return [self.get(x, y) for x, y in locations]
+
+    def is_occupied(self, xs, ys):
+        """ Vectorised occupancy test for arrays of in-grid coordinates """
+        return self.counts[xs, ys] > 0
+
+    def get_all(self):
+        entities = list()
+        for column in self.cells:
+            for cell in column:
+                entities += cell
+        for cell in self.outside_cells.values():
+            entities += cell
+        return entities
+
+    def remove_from(self, entity, x: int, y: int):
+        cell = self.get_cell(x, y)
+        if cell and entity in cell:
+            cell.remove(entity)
+            if self.is_in_grid(x, y):
+                self.counts[x, y] -= 1
+
+    def get_cell(self, x: int, y: int, create: bool = False):
+        if self.is_in_grid(x, y):
+            return self.cells[x][y]
+
+        if create:
+            return self.outside_cells.setdefault((x, y), list())
+        return self.outside_cells.get((x, y))
+
+    def is_in_grid(self, x: int, y: int):
+        return 0 <= x < self.width and 0 <= y < self.height
@@ -0,0 +1,71 @@
+import numpy as np
+import tcod
+from entities.material_grid import MaterialType
+
+# The eight directions a spotting line can snap to, in the order ties between them are broken
+snap_directions = np.array([(-1,-1), (0,-1), (1,-1), (-1,0), (1,0), (-1,1), (0,1), (1,1)])
+spot_line_length = 10
+
+
+def get_line_offsets(dx, dy):
+    """ Returns the (x, y) offsets, as an (n, 2) array, of a line spot_line_length long starting at the origin and heading along dx, dy """
+    magnitude = np.sqrt(dx ** 2 + dy ** 2)
+    return tcod.los.bresenham((0, 0), (int(dx / magnitude * spot_line_length), int(dy / magnitude * spot_line_length)))
+
+
+class SpottingRay:
+    """
+    Works out what a spotting line can see through a section's material. The lines for the eight snapped directions are built once,
+    and the last result is kept until the line's origin, direction or the board itself changes, so idle frames cost a comparison.
+    """
+    def __init__(self, section):
+        self.section = section
+        self.snap_offsets = [get_line_offsets(dx, dy) for dx, dy in snap_directions]
+
+        self.cache_key = None
+        self.spotted_tiles = list()
+        self.spotted_statue_tiles = 0
+
+    def spot(self, origin, target, snap: bool, board_version: int, max_depth: int):
+        """ Returns the tiles visible along the line from origin towards target, and how many of them are statue material """
+        if snap:
+            direction = self.get_snap_direction(origin, target)
+            key = (tuple(origin), direction, board_version, max_depth)
+        else:
+            key = (tuple(origin), tuple(target), board_version, max_depth)
+
+        if key != self.cache_key:
+            if snap:
+                offsets = self.snap_offsets[direction]
+            else:
+                offsets = get_line_offsets(target[0] - origin[0], target[1] - origin[1])
+            self.evaluate(origin, offsets, max_depth)
+            self.cache_key = key
+
+        return self.spotted_tiles, self.spotted_statue_tiles
+
+    def get_snap_direction(self, origin, target):
+        """ Index into snap_directions of the neighbour of origin nearest target """
+        distances = ((snap_directions + origin - target) ** 2).sum(axis=1)
+        return int(np.argmin(distances))
+
+    def evaluate(self, origin, offsets, max_depth: int):
+        xs = offsets[:, 0] + origin[0]
+        ys = offsets[:, 1] + origin[1]
+        inside = (xs >= 0) & (xs < self.section.width) & (ys >= 0) & (ys < self.section.height)
+        xs = xs[inside]
+        ys = ys[inside]
+
+        materials = self.section.materials
+        material = materials.alive[xs, ys]
+        occupied = self.section.entity_index.is_occupied(xs, ys)
+        depth = np.cumsum(material)
+
+        # The line stops at material deeper than the rules allow, or at the first empty tile once it has passed through any material
+        stops = np.flatnonzero((material & (depth > max_depth)) | (~material & ~occupied & (depth > 0)))
+        end = stops[0] if len(stops) > 0 else len(xs)
+
+        xs = xs[:end]
+        ys = ys[:end]
+        self.spotted_statue_tiles = int(np.count_nonzero(material[:end] & (materials.kind[xs, ys] == MaterialType.STATUE)))
+        self.spotted_tiles = list(zip(xs.tolist(), ys.tolist()))
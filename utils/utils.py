@@ -8,4 +8,22 @@ def translate_range(value, leftMin, leftMax, rightMin, rightMax):
     valueScaled = float(value - leftMin) / float(leftSpan)
 
     # Convert the 0-1 range into a value in the right range.
-    return rightMin + (valueScaled * rightSpan)
\ No newline at end of file
+    return rightMin + (valueScaled * rightSpan)
+
+def blit_tiles(console, tiles, src_x, src_y, dest_x, dest_y, width=0, height=0):
+    """ Copies a region of tiles straight into console.tiles_rgb, clipped the way Console.blit clips, where a width or height of 0 means all of tiles """
+    if width == 0:
+        width = tiles.shape[0]
+    if height == 0:
+        height = tiles.shape[1]
+
+    start_x = max(src_x, 0, src_x - dest_x)
+    start_y = max(src_y, 0, src_y - dest_y)
+    end_x = min(src_x + width, tiles.shape[0], console.width - dest_x + src_x)
+    end_y = min(src_y + height, tiles.shape[1], console.height - dest_y + src_y)
+    if end_x <= start_x or end_y <= start_y:
+        return
+
+    offset_x = dest_x - src_x
+    offset_y = dest_y - src_y
+    console.tiles_rgb[start_x + offset_x:end_x + offset_x, start_y + offset_y:end_y + offset_y] = tiles[start_x:end_x, start_y:end_y]
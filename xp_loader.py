@@ -263,3 +263,73 @@ def parse_individual_cell(cell_string, reverse_endian=True):
 
 	keycode = cp437[keycode]
 	return (keycode, (fore_r, fore_g, fore_b), (back_r, back_g, back_b))
+
+
+##################################
+# Vectorised alternative to load_xp_string. Each layer is read straight out of the buffer with np.frombuffer using a packed
+# per-cell dtype, the cp437 lookup is done as a single fancy-index, and every layer is returned as a Fortran ordered
+# graphic_dt array indexed [x, y], ready to be slice-assigned into Console.tiles_rgb or a section's tiles["graphic"].
+# The returned dictionary matches load_xp_string, except that layer_data is a list of those arrays.
+##################################
+
+layer_cell_dt = np.dtype(
+	[
+		("keycode", "<u4"),
+		("fg", "3B"),
+		("bg", "3B")
+	]
+)
+
+def load_xp_array(file_string):
+	version, layer_count = np.frombuffer(file_string, dtype="<u4", count=2)
+	offset = version_bytes + layer_count_bytes
+
+	layers = []
+
+	current_largest_width = 0
+	current_largest_height = 0
+
+	for layer in range(layer_count):
+		width, height = np.frombuffer(file_string, dtype="<u4", count=2, offset=offset)
+		offset += layer_width_bytes + layer_height_bytes
+
+		# Cells are stored column by column, so a C ordered (width, height) reshape gives [x, y] indexing
+		cells = np.frombuffer(file_string, dtype=layer_cell_dt, count=width * height, offset=offset).reshape((width, height))
+		offset += layer_cell_bytes * width * height
+
+		tiles = np.empty((width, height), dtype=graphic_dt, order="F")
+		tiles["ch"] = cp437[cells["keycode"]]
+		tiles["fg"] = cells["fg"]
+		tiles["bg"] = cells["bg"]
+		layers.append(tiles)
+
+		current_largest_width = max(current_largest_width, int(width))
+		current_largest_height = max(current_largest_height, int(height))
+
+	return {
+		'version':int(version),
+		'layer_count':int(layer_count),
+		'width':current_largest_width,
+		'height':current_largest_height,
+		'layer_data':layers
+	}
+
+##################################
+# Packs the layers returned by load_xp_array into one Fortran ordered (width, height, layer_count) graphic_dt array, and back again.
+# This is the form compiled assets are stored in on disk, so that the whole file can be saved or memory mapped in one go.
+##################################
+
+def stack_layers(xp_data):
+	tiles = np.zeros((xp_data['width'], xp_data['height'], xp_data['layer_count']), dtype=graphic_dt, order="F")
+	for layer, layer_tiles in enumerate(xp_data['layer_data']):
+		tiles[0:layer_tiles.shape[0], 0:layer_tiles.shape[1], layer] = layer_tiles
+	return tiles
+
+def unstack_layers(tiles, version):
+	return {
+		'version':version,
+		'layer_count':tiles.shape[2],
+		'width':tiles.shape[0],
+		'height':tiles.shape[1],
+		'layer_data':[tiles[:, :, layer] for layer in range(tiles.shape[2])]
+	}